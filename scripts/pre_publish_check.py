@@ -6,33 +6,90 @@ Runs all the checks mentioned in the copilot instructions to ensure
 the package is ready for publishing.
 """
 
+import asyncio
+import collections
+import concurrent.futures
+import hashlib
+import importlib
+import importlib.metadata
+import importlib.util
+import json
 import os
+import re
 import sys
-import subprocess
 import tempfile
+import venv
 import shutil
 from pathlib import Path
 
-def run_command(cmd, description, advisory=False):
-    """Run a command and report success/failure."""
+# The interpreter running this script, so every tool targets the same environment.
+PYTHON = sys.executable
+
+# Stable pip cache so repeat runs (and ephemeral shells that keep $HOME)
+# reuse built wheels instead of rebuilding sdists.
+PIP_CACHE = Path.home() / ".cache" / "spytial-prepublish-pip"
+
+# Records what the last successful install was run against, so re-runs with
+# unchanged packaging metadata can skip pip entirely.
+STATE_FILE = ".spytial-prepublish-state.json"
+INSTALL_METADATA = (
+    "setup.py",
+    "requirements.txt",
+    "spytial/requirements.txt",
+    "pyproject.toml",
+)
+
+# (mtime, size) of every file each lint tool last passed on, so unchanged
+# files are not re-checked. Recorded against the tool's version and the config
+# files it reads; a change to either re-checks everything.
+LINT_STATE_FILE = ".spytial-lint-state.json"
+LINT_CONFIG = ("pyproject.toml", "setup.cfg", ".flake8", "tox.ini")
+
+# What the start of a generated diagram must look like.
+_HTML_RE = re.compile(rb"<\s*html|<!doctype\s+html", re.IGNORECASE)
+
+# Lines of combined output kept per command for the failure report.
+OUTPUT_TAIL_LINES = 200
+
+
+async def run_command(cmd, description, advisory=False, on_success=None, cwd=None):
+    """Run a command (an argv list, no shell) and report success/failure.
+
+    ``on_success`` is called only when the command really exits 0, even for
+    advisory checks that report success regardless. ``cwd`` defaults to the
+    project root.
+    """
     print(f"🔍 {description}...")
     try:
-        # Ensure we run from the project root directory
-        project_root = Path(__file__).parent.parent
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, cwd=project_root)
-        if result.returncode != 0:
+        if cwd is None:
+            cwd = Path(__file__).parent.parent
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=cwd,
+            limit=1 << 20,
+        )
+        # Keep only the tail so memory stays bounded however chatty the
+        # command is (a verbose pytest run can print tens of MB).
+        tail = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+        async for line in proc.stdout:
+            tail.append(line.decode(errors="replace"))
+        await proc.wait()
+        output = "".join(tail)
+        if proc.returncode != 0:
             if advisory:
                 print(f"⚠️  {description} ADVISORY: Issues found but not blocking")
-                print(f"STDOUT: {result.stdout}")
-                print(f"STDERR: {result.stderr}")
+                print(f"OUTPUT: {output}")
                 return True  # Don't block on advisory checks
             else:
                 print(f"❌ {description} FAILED")
-                print(f"STDOUT: {result.stdout}")
-                print(f"STDERR: {result.stderr}")
+                print(f"OUTPUT: {output}")
                 return False
         else:
             print(f"✅ {description} PASSED")
+            if on_success is not None:
+                on_success()
             return True
     except Exception as e:
         if advisory:
@@ -42,6 +99,107 @@ def run_command(cmd, description, advisory=False):
             print(f"❌ {description} ERROR: {e}")
             return False
 
+
+def install_fingerprint(cmd):
+    """Hash the install command together with the packaging metadata it reads."""
+    project_root = Path(__file__).parent.parent
+    digest = hashlib.sha256("\0".join(cmd).encode())
+    for name in INSTALL_METADATA:
+        path = project_root / name
+        if path.exists():
+            digest.update(name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+async def install_once(cmd, description):
+    """Run an install command unless it already succeeded for this metadata."""
+    state_file = Path(__file__).parent.parent / STATE_FILE
+    fingerprint = install_fingerprint(cmd)
+    try:
+        cached = json.loads(state_file.read_text()).get("install_hash")
+    except (OSError, ValueError):
+        cached = None
+    if cached == fingerprint:
+        print(f"⏭️  {description}: cached, packaging metadata unchanged")
+        return True
+    ok = await run_command(cmd, description)
+    if ok:
+        state_file.write_text(json.dumps({"install_hash": fingerprint}))
+    return ok
+
+
+def lint_fingerprint(tool_argv):
+    """Hash a lint tool's argv and version with the config files it reads."""
+    project_root = Path(__file__).parent.parent
+    digest = hashlib.sha256("\0".join(tool_argv[1:]).encode())
+    # tool_argv is [python, "-m", <module>, ...]; the module names its distribution.
+    try:
+        digest.update(importlib.metadata.version(tool_argv[2]).encode())
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    for name in LINT_CONFIG:
+        path = project_root / name
+        if path.exists():
+            digest.update(name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+async def lint_changed(tool_argv, description):
+    """Run an advisory lint tool only over package files changed since it passed."""
+    project_root = Path(__file__).parent.parent
+    state_file = project_root / LINT_STATE_FILE
+    key = " ".join(tool_argv[1:])
+    # The tool may have been installed or upgraded by this very run.
+    importlib.invalidate_caches()
+    fingerprint = lint_fingerprint(tool_argv)
+
+    def load_state():
+        try:
+            return json.loads(state_file.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    current = {}
+    for path in sorted((project_root / "spytial").rglob("*.py")):
+        stat = path.stat()
+        name = path.relative_to(project_root).as_posix()
+        current[name] = [stat.st_mtime, stat.st_size]
+    recorded = load_state().get(key, {})
+    if recorded.get("fingerprint") == fingerprint:
+        recorded = recorded.get("files", {})
+    else:
+        recorded = {}
+    changed = [
+        name for name, signature in current.items()
+        if recorded.get(name) != signature
+    ]
+    if not changed:
+        print(f"⏭️  {description}: no Python files changed")
+        return True
+
+    def record():
+        # Re-read so concurrent lint checks don't drop each other's entries.
+        state = load_state()
+        state[key] = {"fingerprint": fingerprint, "files": current}
+        state_file.write_text(json.dumps(state))
+
+    return await run_command(
+        tool_argv + changed, description, advisory=True, on_success=record
+    )
+
+
+def pytest_command():
+    """The test-suite argv, spread across CPUs when pytest-xdist is available."""
+    cmd = [PYTHON, "-m", "pytest", "test/", "-v"]
+    # pytest-xdist may have been installed by this very run.
+    importlib.invalidate_caches()
+    if importlib.util.find_spec("xdist") is not None:
+        cmd += ["-n", "auto", "--dist=loadfile"]
+    return cmd
+
+
 def validate_imports_and_functionality():
     """Test import and basic functionality."""
     print("🔍 Testing imports and basic functionality...")
@@ -65,13 +223,15 @@ def validate_imports_and_functionality():
         
         # Validate file was created and contains valid content
         if os.path.exists(result):
-            with open(result, 'r') as f:
-                content = f.read()
-                if 'html' in content.lower() and len(content) > 1000:
-                    print("✅ Basic visualization works")
-                else:
-                    print("❌ Generated HTML content is invalid")
-                    return False
+            # Size plus the document head is enough; no need to load the
+            # whole (possibly multi-MB) diagram.
+            with open(result, 'rb') as f:
+                head = f.read(4096)
+            if os.path.getsize(result) > 1000 and _HTML_RE.search(head):
+                print("✅ Basic visualization works")
+            else:
+                print("❌ Generated HTML content is invalid")
+                return False
         else:
             print("❌ Visualization file was not created")
             return False
@@ -112,101 +272,229 @@ def validate_imports_and_functionality():
         traceback.print_exc()
         return False
 
-def main():
-    """Run all pre-publish checks."""
+
+def clean_build_artifacts():
+    """Remove build/, dist/ and *.egg-info/ left over from earlier builds."""
+    print("🔍 Cleaning previous builds...")
+    project_root = Path(__file__).parent.parent
+    for path in (
+        project_root / "build",
+        project_root / "dist",
+        *project_root.glob("*.egg-info"),
+    ):
+        shutil.rmtree(path, ignore_errors=True)
+    print("✅ Cleaning previous builds PASSED")
+    return True
+
+
+def build_distributions():
+    """Build the sdist and wheel in-process (equivalent to --no-isolation)."""
+    print("🔍 Building package...")
+    try:
+        from build import ProjectBuilder
+
+        project_root = Path(__file__).parent.parent
+        builder = ProjectBuilder(project_root)
+        missing = builder.check_dependencies("wheel")
+        if missing:
+            print(f"❌ Building package FAILED: missing build dependencies {missing}")
+            return False
+        for distribution in ("sdist", "wheel"):
+            builder.build(distribution, project_root / "dist")
+        print("✅ Building package PASSED")
+        return True
+    except Exception as e:
+        print(f"❌ Building package ERROR: {e}")
+        return False
+
+
+def check_distributions():
+    """Run twine's metadata check over everything in dist/."""
+    print("🔍 Checking distribution...")
+    try:
+        from twine.commands.check import check
+
+        dist_dir = Path(__file__).parent.parent / "dist"
+        dists = sorted(str(p) for p in dist_dir.iterdir())
+        # check() returns True when any distribution fails.
+        if check(dists, strict=False):
+            print("❌ Checking distribution FAILED")
+            return False
+        print("✅ Checking distribution PASSED")
+        return True
+    except Exception as e:
+        print(f"❌ Checking distribution ERROR: {e}")
+        return False
+
+
+# Run inside the fresh venv: fails unless spytial came from that venv.
+WHEEL_IMPORT_CHECK = (
+    "import pathlib, sys, spytial; "
+    "where = pathlib.Path(spytial.__file__).resolve(); "
+    "assert pathlib.Path(sys.prefix).resolve() in where.parents, where"
+)
+
+
+async def test_wheel_install(tmpdir):
+    """Install the built wheel into a fresh venv and import it from there."""
+    print("🔍 Testing install from built package...")
+    wheels = sorted((Path(__file__).parent.parent / "dist").glob("*.whl"))
+    if not wheels:
+        print("❌ Testing install from built package FAILED: no wheel in dist/")
+        return False
+    wheel = wheels[-1]
+    try:
+        env_dir = tmpdir / "venv"
+        await asyncio.get_running_loop().run_in_executor(
+            None, venv.EnvBuilder(with_pip=True).create, env_dir
+        )
+    except Exception as e:
+        print(f"❌ Testing install from built package ERROR: {e}")
+        return False
+    bin_dir = env_dir / ("Scripts" if sys.platform == "win32" else "bin")
+    python = bin_dir / "python"
+    return (
+        await run_command(
+            [
+                str(python), "-m", "pip", "install",
+                "--cache-dir", str(PIP_CACHE), str(wheel),
+            ],
+            "Installing built wheel into a clean venv"
+        )
+        # Isolated mode, run outside the checkout: the source tree's
+        # ./spytial must not shadow the installed copy.
+        and await run_command(
+            [str(python), "-I", "-c", WHEEL_IMPORT_CHECK],
+            "Importing spytial from the built wheel",
+            cwd=tmpdir,
+        )
+    )
+
+# A node in the check pipeline: ``run`` is a zero-argument coroutine function
+# returning True/False, started once every check named in ``deps`` has passed.
+Check = collections.namedtuple("Check", "name run deps")
+
+
+def in_thread(fn, *args):
+    """Adapt a blocking check into a coroutine function for the pipeline."""
+    async def run():
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+    return run
+
+
+def in_process(fn):
+    """Like in_thread, but in a child interpreter that exits afterwards.
+
+    For checks that import spytial or mutate ``sys.path``; the state they
+    leave behind dies with the worker instead of leaking into this process.
+    """
+    async def run():
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1) as pool:
+            return await asyncio.get_running_loop().run_in_executor(pool, fn)
+    return run
+
+
+async def run_checks(checks):
+    """Run checks as soon as their dependencies pass.
+
+    Returns ``{name: True | False | None}``; ``None`` means the check was
+    skipped because something upstream failed.
+    """
+    tasks = {}
+
+    async def run_one(check):
+        upstream = [await tasks[dep] for dep in check.deps]
+        if not all(upstream):
+            print(f"⏭️  {check.name} SKIPPED (upstream failed)")
+            return None
+        return await check.run()
+
+    # Checks are listed in dependency order, so every dep's task exists.
+    for check in checks:
+        tasks[check.name] = asyncio.ensure_future(run_one(check))
+    return {name: await task for name, task in tasks.items()}
+
+
+async def main():
+    """Run all pre-publish checks.
+
+    Independent checks run concurrently; only the real dependency chain is
+    serialized: install -> checks -> build -> checks on the built package.
+    Once a check fails, everything downstream of it is skipped.
+    """
     print("🚀 sPyTial Pre-Publish Validation")
     print("=" * 50)
     
-    checks = []
-    
-    # Install package in development mode
-    checks.append(run_command(
-        "python -m pip install -e .",
-        "Installing package in development mode"
-    ))
-    
-    # Install development dependencies
-    checks.append(run_command(
-        "python -m pip install pytest>=7.0.0 flake8>=6.0.0 black>=23.0.0",
-        "Installing development dependencies"
-    ))
-    
-    # Code formatting check (advisory)
-    checks.append(run_command(
-        "python -m black spytial/ --check",
-        "Code formatting check",
-        advisory=True
-    ))
-    
-    # Linting (advisory)
-    checks.append(run_command(
-        "python -m flake8 spytial/ --count --statistics --max-line-length=88 --extend-ignore=E203,W503",
-        "Code linting",
-        advisory=True
-    ))
-    
-    # Run tests
-    checks.append(run_command(
-        "python -m pytest test/ -v",
-        "Running test suite"
-    ))
-    
-    # Functionality validation
-    checks.append(validate_imports_and_functionality())
-    
-    # Build package
-    checks.append(run_command(
-        "python -m pip install build",
-        "Installing build tools"
-    ))
-    
-    # Clean previous builds
-    checks.append(run_command(
-        "rm -rf build/ dist/ *.egg-info/",
-        "Cleaning previous builds"
-    ))
-    
-    # Build
-    checks.append(run_command(
-        "python -m build --no-isolation",
-        "Building package"
-    ))
-    
-    # Check distribution
-    checks.append(run_command(
-        "python -m pip install twine && twine check dist/*",
-        "Checking distribution"
-    ))
-    
-    # Test install from built package
-    project_root = Path(__file__).parent.parent
     with tempfile.TemporaryDirectory() as tmpdir:
-        checks.append(run_command(
-            f"cd {tmpdir} && python -m pip install {project_root}/dist/*.whl && python -c 'import spytial; print(\"✅ Package install test passed\")'",
-            "Testing install from built package"
-        ))
+        results = await run_checks([
+            # Install the package plus dev and build tools in one resolver pass
+            Check("install", lambda: install_once(
+                [PYTHON, "-m", "pip", "install", "--cache-dir", str(PIP_CACHE),
+                 "-e", ".", "build", "twine", "wheel",
+                 "pytest>=7.0.0", "pytest-xdist", "flake8>=6.0.0", "black>=23.0.0"],
+                "Installing package with dev and build dependencies"
+            ), ()),
+            # Formatting and linting (advisory) alongside the test suite
+            Check("format", lambda: lint_changed(
+                [PYTHON, "-m", "black", "--check"],
+                "Code formatting check"
+            ), ("install",)),
+            Check("lint", lambda: lint_changed(
+                [PYTHON, "-m", "flake8", "--count", "--statistics",
+                 "--max-line-length=88", "--extend-ignore=E203,W503"],
+                "Code linting"
+            ), ("install",)),
+            Check("tests", lambda: run_command(
+                pytest_command(),
+                "Running test suite"
+            ), ("install",)),
+            # Functionality validation
+            Check(
+                "functionality",
+                in_process(validate_imports_and_functionality),
+                ("install",),
+            ),
+            # Only build something that passed the tests
+            Check(
+                "clean",
+                in_thread(clean_build_artifacts),
+                ("tests", "functionality"),
+            ),
+            Check("build", in_thread(build_distributions), ("clean",)),
+            # Check distribution and test install from built package
+            Check("twine", in_thread(check_distributions), ("build",)),
+            Check("wheel", lambda: test_wheel_install(Path(tmpdir)), ("build",)),
+        ])
+    checks = list(results.values())
     
     # Summary
     print("\n" + "=" * 50)
     print("📊 VALIDATION SUMMARY")
     print("=" * 50)
     
-    passed = sum(checks)
+    passed = checks.count(True)
+    skipped = checks.count(None)
     total = len(checks)
     
     if passed == total:
         print(f"🎉 ALL CHECKS PASSED! ({passed}/{total})")
         print("\n✅ sPyTial is ready for publishing!")
         print("\nNext steps:")
-        print("1. Commit your changes: git add . && git commit -m 'Prepare for release'")
+        print(
+            "1. Commit your changes: "
+            "git add . && git commit -m 'Prepare for release'"
+        )
         print("2. Create a release tag: git tag v0.1.0 && git push origin v0.1.0")
         print("3. Create a GitHub release to trigger automated publishing")
         print("   OR manually publish: twine upload dist/*")
         return 0
     else:
-        print(f"❌ {total - passed} CHECKS FAILED! ({passed}/{total})")
+        failed = total - passed - skipped
+        print(
+            f"❌ {failed} CHECKS FAILED, {skipped} SKIPPED! ({passed}/{total})"
+        )
         print("\n🔧 Please fix the failing checks before publishing.")
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(asyncio.run(main()))
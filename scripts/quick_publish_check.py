@@ -4,19 +4,33 @@ Quick pre-publish validation that focuses on core functionality
 and skips advanced tests that may have missing features.
 """
 
+import collections
 import subprocess
 import sys
 from pathlib import Path
 
+# The interpreter running this script, so every tool targets the same environment.
+PYTHON = sys.executable
+
+# Shared with pre_publish_check.py so both scripts reuse the same built wheels.
+PIP_CACHE = Path.home() / ".cache" / "spytial-prepublish-pip"
+
+# Lines of combined output kept per command for the failure report.
+OUTPUT_TAIL_LINES = 200
+
 def run_cmd(cmd, description):
+    """Run a command (an argv list, no shell) and report success/failure."""
     print(f"🔍 {description}...")
     try:
         project_root = Path(__file__).parent.parent
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, cwd=project_root)
-        if result.returncode != 0:
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, errors="replace", cwd=project_root,
+        )
+        tail = collections.deque(proc.stdout, maxlen=OUTPUT_TAIL_LINES)
+        if proc.wait() != 0:
             print(f"❌ {description} FAILED")
-            if result.stdout: print(f"STDOUT: {result.stdout}")
-            if result.stderr: print(f"STDERR: {result.stderr}")
+            if tail: print(f"OUTPUT: {''.join(tail)}")
             return False
         print(f"✅ {description} PASSED")
         return True
@@ -29,12 +43,33 @@ def main():
     print("=" * 50)
     
     # Just the essential checks for publishing
+    project_root = Path(__file__).parent.parent
     checks = [
-        run_cmd("python -m pip install -e .", "Installing package"),
-        run_cmd("python -m black spytial/ --check", "Code formatting check"),
-        run_cmd("python -m build", "Building package"),
-        run_cmd("python -m pip install twine && twine check dist/*", "Distribution check"),
+        run_cmd(
+            [
+                PYTHON,
+                "-m",
+                "pip",
+                "install",
+                "--cache-dir",
+                str(PIP_CACHE),
+                "-e",
+                ".",
+                "build",
+                "twine",
+                "wheel",
+            ],
+            "Installing package with build tools",
+        ),
+        run_cmd(
+            [PYTHON, "-m", "black", "spytial/", "--check"], "Code formatting check"
+        ),
+        run_cmd([PYTHON, "-m", "build"], "Building package"),
     ]
+    dists = sorted(str(p) for p in (project_root / "dist").glob("*"))
+    checks.append(
+        run_cmd([PYTHON, "-m", "twine", "check", *dists], "Distribution check")
+    )
     
     # Test basic functionality 
     print("🔍 Testing core functionality...")
@@ -1,113 +1,8 @@
-from ._version import __version__
-from .provider_system import (
-    # New relationalizer system
-    CnDDataInstanceBuilder,
-    RelationalizerBase,
-    RelationalizerRegistry,
-    relationalizer,
-    Atom,
-    Relation,
-    # Structured input: the inverse of build_instance / diagram
-    reify,
-    replit,
-)
-from .visualizer import (
-    diagram,
-    SequenceRecorder,
-    sequence,
-    SEQUENCE_POLICY_NAMES,
-    LABEL_STRATEGY_NAMES,
-)
-from .evaluator import evaluate
-from .structured_input import edit, edit_html, EditCancelled
-from .utils import AnnotatedType
-from .core_assets import get_spytial_core_version
-from .annotations import (
-    # Class decorators (for decorating classes)
-    orientation,
-    cyclic,
-    align,
-    group,
-    atomColor,
-    atomStyle,
-    size,
-    icon,
-    edgeColor,
-    edgeStyle,
-    projection,
-    attribute,
-    hideField,
-    hideAtom,
-    inferredEdge,
-    tag,
-    flag,
-    # Style blocks (spytial-core 3.0 style system)
-    LineStyle,
-    TextStyle,
-    BorderStyle,
-    FillStyle,
-    GroupEdge,
-    # Object annotation functions
-    annotate,
-    annotate_orientation,
-    annotate_cyclic,
-    annotate_align,
-    annotate_group,
-    annotate_atomColor,
-    annotate_atomStyle,
-    annotate_size,
-    annotate_icon,
-    annotate_edgeColor,
-    annotate_edgeStyle,
-    annotate_projection,
-    annotate_attribute,
-    annotate_hideField,
-    annotate_hideAtom,
-    annotate_inferredEdge,
-    annotate_tag,
-    annotate_flag,
-    # Type alias annotation classes (for use with typing.Annotated)
-    SpytialAnnotation,
-    Orientation,
-    Cyclic,
-    Align,
-    Group,
-    AtomColor,
-    AtomStyle,
-    Size,
-    Icon,
-    EdgeColor,
-    EdgeStyle,
-    HideField,
-    HideAtom,
-    Projection,
-    Attribute,
-    InferredEdge,
-    Tag,
-    Flag,
-    extract_spytial_annotations,
-    get_base_type,
-    # Legacy type alias functions (prefer using typing.Annotated instead)
-    annotate_type_alias,
-    get_type_alias_annotations,
-    clear_type_alias_annotations,
-    list_type_alias_annotations,
-    # Inheritance control decorators
-    dont_inherit_constraints,
-    dont_inherit_directives,
-    dont_inherit_annotations,
-    # Utility functions
-    collect_decorators,
-    serialize_to_yaml_string,
-    reset_object_ids,
-    apply_if,
-)
-
-# Main data instance builder
-CnDDataInstanceBuilder = CnDDataInstanceBuilder
+import os as _os
 
+from ._version import __version__
 
-__all__ = [
+__all__ = (
     "__version__",
     # Core functions
     "diagram",
@@ -205,16 +100,133 @@ __all__ = [
     # Utility functions
     "collect_decorators",
     "serialize_to_yaml_string",
+    "serialize_to_json_string",
     "reset_object_ids",
     "apply_if",
     # Core version
     "get_spytial_core_version",
     # Spec scaffolding (lazy — see __getattr__)
     "suggest",
-]
+)
+
+
+# Every public name loads on first use (PEP 562), so ``import spytial`` costs
+# next to nothing: the builder and annotation machinery only load once a spec
+# or data instance is built, and rendering and editing (the HTML templates'
+# machinery, the local edit server, webbrowser) only once a diagram is drawn.
+_LAZY_ATTRS = {
+    # New relationalizer system
+    "CnDDataInstanceBuilder": "provider_system",
+    "RelationalizerBase": "provider_system",
+    "RelationalizerRegistry": "provider_system",
+    "relationalizer": "provider_system",
+    "Atom": "provider_system",
+    "Relation": "provider_system",
+    # Structured input: the inverse of build_instance / diagram
+    "reify": "provider_system",
+    "replit": "provider_system",
+    "AnnotatedType": "utils",
+    "get_spytial_core_version": "core_assets",
+    # Class decorators (for decorating classes)
+    "orientation": "annotations",
+    "cyclic": "annotations",
+    "align": "annotations",
+    "group": "annotations",
+    "atomColor": "annotations",
+    "atomStyle": "annotations",
+    "size": "annotations",
+    "icon": "annotations",
+    "edgeColor": "annotations",
+    "edgeStyle": "annotations",
+    "projection": "annotations",
+    "attribute": "annotations",
+    "hideField": "annotations",
+    "hideAtom": "annotations",
+    "inferredEdge": "annotations",
+    "tag": "annotations",
+    "flag": "annotations",
+    # Style blocks (spytial-core 3.0 style system)
+    "LineStyle": "annotations",
+    "TextStyle": "annotations",
+    "BorderStyle": "annotations",
+    "FillStyle": "annotations",
+    "GroupEdge": "annotations",
+    # Object annotation functions
+    "annotate": "annotations",
+    "annotate_orientation": "annotations",
+    "annotate_cyclic": "annotations",
+    "annotate_align": "annotations",
+    "annotate_group": "annotations",
+    "annotate_atomColor": "annotations",
+    "annotate_atomStyle": "annotations",
+    "annotate_size": "annotations",
+    "annotate_icon": "annotations",
+    "annotate_edgeColor": "annotations",
+    "annotate_edgeStyle": "annotations",
+    "annotate_projection": "annotations",
+    "annotate_attribute": "annotations",
+    "annotate_hideField": "annotations",
+    "annotate_hideAtom": "annotations",
+    "annotate_inferredEdge": "annotations",
+    "annotate_tag": "annotations",
+    "annotate_flag": "annotations",
+    # Type alias annotation classes (for use with typing.Annotated)
+    "SpytialAnnotation": "annotations",
+    "Orientation": "annotations",
+    "Cyclic": "annotations",
+    "Align": "annotations",
+    "Group": "annotations",
+    "AtomColor": "annotations",
+    "AtomStyle": "annotations",
+    "Size": "annotations",
+    "Icon": "annotations",
+    "EdgeColor": "annotations",
+    "EdgeStyle": "annotations",
+    "HideField": "annotations",
+    "HideAtom": "annotations",
+    "Projection": "annotations",
+    "Attribute": "annotations",
+    "InferredEdge": "annotations",
+    "Tag": "annotations",
+    "Flag": "annotations",
+    "extract_spytial_annotations": "annotations",
+    "get_base_type": "annotations",
+    # Legacy type alias functions (prefer using typing.Annotated instead)
+    "annotate_type_alias": "annotations",
+    "get_type_alias_annotations": "annotations",
+    "clear_type_alias_annotations": "annotations",
+    "list_type_alias_annotations": "annotations",
+    # Inheritance control decorators
+    "dont_inherit_constraints": "annotations",
+    "dont_inherit_directives": "annotations",
+    "dont_inherit_annotations": "annotations",
+    # Utility functions
+    "collect_decorators": "annotations",
+    "serialize_to_yaml_string": "annotations",
+    "serialize_to_json_string": "annotations",
+    "reset_object_ids": "annotations",
+    "apply_if": "annotations",
+    # Rendering and editing
+    "diagram": "visualizer",
+    "SequenceRecorder": "visualizer",
+    "sequence": "visualizer",
+    "SEQUENCE_POLICY_NAMES": "visualizer",
+    "LABEL_STRATEGY_NAMES": "visualizer",
+    "evaluate": "evaluator",
+    "edit": "structured_input",
+    "edit_html": "structured_input",
+    "EditCancelled": "structured_input",
+}
 
 
 def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is not None:
+        import importlib
+
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+        globals()[name] = value
+        return value
     # ``spytial.suggest`` stays out of the eager imports (it is optional
     # machinery that must remain dormant until reached for), but the natural
     # call spelling — ``spytial.suggest(tree, ask=..., enrich=...)`` — should
@@ -226,3 +238,15 @@ def __getattr__(name):
 
         return importlib.import_module("spytial.suggest")
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_LAZY_ATTRS))
+
+
+# Debug/CI aid: a broken lazy name would otherwise only fail on first use.
+# SPYTIAL_EAGER_IMPORT=1 resolves every name now, surfacing it at import.
+if _os.environ.get("SPYTIAL_EAGER_IMPORT") == "1":
+    for _name in _LAZY_ATTRS:
+        __getattr__(_name)
+    del _name
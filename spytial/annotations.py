@@ -3,17 +3,78 @@
 #
 
 
-import yaml
 import re
 import json
+import itertools
+import threading
+import typing
 import warnings
 import weakref
 from dataclasses import dataclass, fields as _dataclass_fields
+from types import MappingProxyType
+from typing import NamedTuple, Tuple
 
+from .utils import dumps_embedded_json
 
-class NoAliasDumper(yaml.Dumper):
-    def ignore_aliases(self, data):
-        return True
+
+# PyYAML is only needed when a spec is actually written out as YAML, so it is
+# imported on first use rather than with the package; diagrams embed JSON.
+_NO_ALIAS_DUMPER = None
+
+
+def _no_alias_dumper():
+    """Return the YAML dumper used for specs, building it on first use."""
+    global _NO_ALIAS_DUMPER
+    if _NO_ALIAS_DUMPER is None:
+        import yaml
+
+        # Spec YAML only ever holds plain dicts, lists and scalars, so the
+        # safe dumper suffices; prefer the libyaml-backed one when PyYAML was
+        # built with it.
+        base = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+        class NoAliasDumper(base):
+            def ignore_aliases(self, data):
+                return True
+
+        # Selectors and directions are sometimes passed as tuples; emit them
+        # as plain YAML sequences rather than failing in the safe representer.
+        NoAliasDumper.add_representer(tuple, yaml.SafeDumper.represent_list)
+        _NO_ALIAS_DUMPER = NoAliasDumper
+    return _NO_ALIAS_DUMPER
+
+
+def __getattr__(name):
+    if name == "NoAliasDumper":
+        return _no_alias_dumper()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _FieldSet(NamedTuple):
+    """One accepted parameter set for an annotation type, frozen for lookup."""
+
+    required: Tuple[str, ...]
+    optional: Tuple[str, ...]
+    needed: frozenset
+    allowed: frozenset
+
+
+def _field_sets(spec):
+    """Normalize a schema entry to a tuple of alternative ``_FieldSet`` s.
+
+    Entries are written as a list of required names, a ``{"required",
+    "optional"}`` dict, or a list of those (alternatives, as for ``group``).
+    """
+    if isinstance(spec, list) and spec and isinstance(spec[0], (list, dict)):
+        return tuple(_field_sets(alternative)[0] for alternative in spec)
+    if isinstance(spec, dict):
+        required = tuple(spec.get("required", ()))
+        optional = tuple(spec.get("optional", ()))
+    else:
+        required, optional = tuple(spec), ()
+    return (
+        _FieldSet(required, optional, frozenset(required), frozenset(required + optional)),
+    )
 
 
 # Registry to store constraints and directives
@@ -71,6 +132,16 @@ DIRECTIVE_TYPES = {
     "flag": ["name"],
 }
 
+# Both tables are authored above in the readable list/dict shorthand and
+# frozen once here: validation (run on every decorator application) then only
+# does tuple scans and frozenset membership, and the schemas can't be mutated.
+CONSTRAINT_TYPES = MappingProxyType(
+    {name: _field_sets(spec) for name, spec in CONSTRAINT_TYPES.items()}
+)
+DIRECTIVE_TYPES = MappingProxyType(
+    {name: _field_sets(spec) for name, spec in DIRECTIVE_TYPES.items()}
+)
+
 # =============================================
 # Style blocks (spytial-core 3.0 style system)
 # =============================================
@@ -615,8 +686,15 @@ _OBJECT_ANNOTATION_REGISTRY = _IdentityKeyedRegistry()
 # Global registry for object IDs (for objects that can't store attributes)
 _OBJECT_ID_REGISTRY = _IdentityKeyedRegistry()
 
-# Counter for generating unique object IDs
-_OBJECT_ID_COUNTER = 0
+# Serializes the *creation* of per-object state (annotation registries and
+# object IDs) so two threads annotating the same object can't each create one
+# and lose the other's. Reads stay lock-free: every write path re-checks under
+# the lock, and lookups only ever see a fully built entry or none.
+_OBJECT_STATE_LOCK = threading.Lock()
+
+# Source of unique object ID numbers; a C-level counter, so allocating one is a
+# single call with no read-modify-write of a module global.
+_next_object_id = itertools.count(1).__next__
 
 # =============================================
 # Type Alias Annotation System using typing.Annotated
@@ -645,18 +723,39 @@ class SpytialAnnotation:
     attached to type aliases using typing.Annotated.
     """
 
+    # Instances are built once per alias and serialized on every lookup, so
+    # they carry no __dict__ and their registry entry is built up front.
+    # Subclasses declare empty __slots__ to keep it that way.
+    __slots__ = ("kwargs", "_entry")
+
     _annotation_type: str = None
     _is_constraint: bool = True
 
+    def __init_subclass__(cls, **kwargs):
+        # Whether a type is a constraint is already settled by which schema
+        # table it lives in; derive it here rather than restating it per class.
+        # Only classes that name a known type themselves are touched, so
+        # intermediate bases and third-party subclasses keep what they declare.
+        super().__init_subclass__(**kwargs)
+        annotation_type = cls.__dict__.get("_annotation_type")
+        if annotation_type in CONSTRAINT_TYPES:
+            cls._is_constraint = True
+        elif annotation_type in DIRECTIVE_TYPES:
+            cls._is_constraint = False
+
     def __init__(self, **kwargs):
         # Every subclass funnels here, so the Annotated[...] form gets the same
         # vocabulary check as the **kwargs paths without restating it per class.
         _validate_values(self._annotation_type, kwargs)
         self.kwargs = kwargs
+        self._entry = {self._annotation_type: self._entry_value()}
+
+    def _entry_value(self):
+        return self.kwargs
 
     def to_entry(self):
-        """Convert to the internal registry format."""
-        return {self._annotation_type: self.kwargs}
+        """Convert to the internal registry format (shared; don't mutate)."""
+        return self._entry
 
     def __repr__(self):
         args = ", ".join(f"{k}={v!r}" for k, v in self.kwargs.items())
@@ -682,8 +781,9 @@ class Orientation(SpytialAnnotation):
         IntList = Annotated[list[int], Orientation(selector='items', directions=['left'])]
     """
 
+    __slots__ = ()
+
     _annotation_type = "orientation"
-    _is_constraint = True
 
     def __init__(self, *, selector: str, directions: list, hold: str = "always"):
         _validate_hold(hold)
@@ -701,8 +801,9 @@ class Cyclic(SpytialAnnotation):
         NodeRing = Annotated[list[Node], Cyclic(selector='items', direction='clockwise')]
     """
 
+    __slots__ = ()
+
     _annotation_type = "cyclic"
-    _is_constraint = True
 
     def __init__(self, *, selector: str, direction: str, hold: str = "always"):
         _validate_hold(hold)
@@ -723,8 +824,9 @@ class Align(SpytialAnnotation):
         AlignedList = Annotated[list[int], Align(selector='items', direction='horizontal')]
     """
 
+    __slots__ = ()
+
     _annotation_type = "align"
-    _is_constraint = True
 
     def __init__(self, *, selector: str, direction: str, hold: str = "always"):
         _validate_hold(hold)
@@ -765,8 +867,9 @@ class Group(SpytialAnnotation):
             textStyle=TextStyle(color='navy'))]
     """
 
+    __slots__ = ()
+
     _annotation_type = "group"
-    _is_constraint = True
 
     def __init__(self, *, hold: str = "always", **kwargs):
         _validate_hold(hold)
@@ -793,8 +896,9 @@ class AtomStyle(SpytialAnnotation):
                                            textStyle=TextStyle(size='large'))]
     """
 
+    __slots__ = ()
+
     _annotation_type = "atomStyle"
-    _is_constraint = False
 
     def __init__(
         self,
@@ -824,6 +928,8 @@ class AtomColor(AtomStyle):
     legacy directive colored the border, not the fill).
     """
 
+    __slots__ = ()
+
     def __init__(self, *, selector: str, value: str):
         _, kwargs = _desugar_legacy_style(
             "atomColor", {"selector": selector, "value": value}, stacklevel=3
@@ -839,8 +945,9 @@ class Size(SpytialAnnotation):
         SizedList = Annotated[list[int], Size(selector='items', height=50, width=50)]
     """
 
+    __slots__ = ()
+
     _annotation_type = "size"
-    _is_constraint = False
 
     def __init__(self, *, selector: str, height: int, width: int):
         super().__init__(selector=selector, height=height, width=width)
@@ -854,8 +961,9 @@ class Icon(SpytialAnnotation):
         IconList = Annotated[list[int], Icon(selector='items', path='icon.svg', showLabels=True)]
     """
 
+    __slots__ = ()
+
     _annotation_type = "icon"
-    _is_constraint = False
 
     def __init__(self, *, selector: str, path: str, showLabels: bool = True):
         super().__init__(selector=selector, path=path, showLabels=showLabels)
@@ -877,8 +985,9 @@ class EdgeStyle(SpytialAnnotation):
         HiddenEdges = Annotated[Tree, EdgeStyle(field='internal', hidden=True)]
     """
 
+    __slots__ = ()
+
     _annotation_type = "edgeStyle"
-    _is_constraint = False
 
     def __init__(
         self,
@@ -915,6 +1024,8 @@ class EdgeColor(EdgeStyle):
     ``style`` -> lineStyle.pattern, ``weight`` -> lineStyle.weight.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -953,8 +1064,9 @@ class HideField(SpytialAnnotation):
         Filtered = Annotated[MyClass, HideField(field='debug', filter='debug & Production')]
     """
 
+    __slots__ = ()
+
     _annotation_type = "hideField"
-    _is_constraint = False
 
     def __init__(self, *, field: str, selector: str = None, filter: str = None):
         kwargs = {"field": field}
@@ -973,8 +1085,9 @@ class HideAtom(SpytialAnnotation):
         Filtered = Annotated[list[int], HideAtom(selector='hidden')]
     """
 
+    __slots__ = ()
+
     _annotation_type = "hideAtom"
-    _is_constraint = False
 
     def __init__(self, *, selector: str):
         super().__init__(selector=selector)
@@ -993,8 +1106,9 @@ class Projection(SpytialAnnotation):
         Projected = Annotated[MyType, Projection(sig='MySig')]  # no-op
     """
 
+    __slots__ = ()
+
     _annotation_type = "projection"
-    _is_constraint = False
 
     def __init__(self, *, sig: str):
         _warn_if_noop("projection", stacklevel=3)
@@ -1010,8 +1124,9 @@ class Attribute(SpytialAnnotation):
         Filtered = Annotated[MyType, Attribute(field='status', filter='status & Active')]
     """
 
+    __slots__ = ()
+
     _annotation_type = "attribute"
-    _is_constraint = False
 
     def __init__(
         self,
@@ -1052,8 +1167,9 @@ class InferredEdge(SpytialAnnotation):
                                                   draw='regions -> regions')]
     """
 
+    __slots__ = ()
+
     _annotation_type = "inferredEdge"
-    _is_constraint = False
 
     def __init__(
         self,
@@ -1096,15 +1212,16 @@ class Flag(SpytialAnnotation):
         Flagged = Annotated[MyType, Flag(name='hideDisconnected')]
     """
 
+    __slots__ = ()
+
     _annotation_type = "flag"
-    _is_constraint = False
 
     def __init__(self, *, name: str):
         super().__init__(name=name)
 
-    def to_entry(self):
+    def _entry_value(self):
         """Flags store just the name as a scalar."""
-        return {self._annotation_type: self.kwargs["name"]}
+        return self.kwargs["name"]
 
 
 class Tag(SpytialAnnotation):
@@ -1122,8 +1239,9 @@ class Tag(SpytialAnnotation):
         Graded = Annotated[MyType, Tag(toTag='Student', name='score', value='grades')]
     """
 
+    __slots__ = ()
+
     _annotation_type = "tag"
-    _is_constraint = False
 
     def __init__(self, *, toTag: str, name: str, value: str, textStyle=None):
         kwargs = {"toTag": toTag, "name": name, "value": value}
@@ -1132,6 +1250,11 @@ class Tag(SpytialAnnotation):
         super().__init__(**_coerce_style_blocks("tag", kwargs))
 
 
+# Annotated alias -> (constraints, directives) read from its metadata. Aliases
+# are usually module-level constants passed to every diagram() call.
+_ANNOTATED_ENTRIES = weakref.WeakKeyDictionary()
+
+
 def extract_spytial_annotations(type_hint):
     """
     Extract spytial annotations from a typing.Annotated type hint.
@@ -1139,8 +1262,27 @@ def extract_spytial_annotations(type_hint):
     :param type_hint: A type hint, possibly Annotated with spytial markers.
     :return: A dict with 'constraints' and 'directives' lists, or None if no annotations.
     """
-    import typing
+    try:
+        cached = _ANNOTATED_ENTRIES.get(type_hint)
+    except TypeError:  # unhashable, or can't be weakly referenced
+        return _read_spytial_annotations(type_hint)
+    if cached is None:
+        cached = _read_spytial_annotations(type_hint)
+        if cached is not None:
+            cached = (tuple(cached["constraints"]), tuple(cached["directives"]))
+        else:
+            cached = ()
+        try:
+            _ANNOTATED_ENTRIES[type_hint] = cached
+        except TypeError:
+            pass
+    if not cached:
+        return None
+    return {"constraints": list(cached[0]), "directives": list(cached[1])}
+
 
+def _read_spytial_annotations(type_hint):
+    """Uncached body of :func:`extract_spytial_annotations`."""
     # Check if it's an Annotated type
     origin = typing.get_origin(type_hint)
     if origin is not typing.Annotated:
@@ -1177,8 +1319,6 @@ def get_base_type(type_hint):
     :param type_hint: A type hint, possibly Annotated.
     :return: The base type (unwrapped from Annotated if applicable).
     """
-    import typing
-
     origin = typing.get_origin(type_hint)
     if origin is typing.Annotated:
         args = typing.get_args(type_hint)
@@ -1190,6 +1330,9 @@ def get_base_type(type_hint):
 # Legacy registry-based system (kept for backward compatibility)
 _TYPE_ALIAS_ANNOTATION_REGISTRY = {}
 
+# Python 3.12+ `type X = ...` aliases; None on older interpreters.
+_TypeAliasType = getattr(typing, "TypeAliasType", None)
+
 
 def _normalize_type_alias_key(type_alias):
     """
@@ -1198,19 +1341,14 @@ def _normalize_type_alias_key(type_alias):
     :param type_alias: The type alias to normalize.
     :return: A hashable key representing the type alias.
     """
-    import typing
-    import sys
+    # Plain classes are the common key and never have an origin.
+    if type(type_alias) is type:
+        return type_alias
 
     # For Python 3.12+ TypeAliasType (from `type X = ...` statement)
-    if sys.version_info >= (3, 12):
-        try:
-            from typing import TypeAliasType
-
-            if isinstance(type_alias, TypeAliasType):
-                # Use the name and underlying value for uniqueness
-                return ("TypeAliasType", type_alias.__name__, type_alias.__value__)
-        except ImportError:
-            pass
+    if _TypeAliasType is not None and isinstance(type_alias, _TypeAliasType):
+        # Use the name and underlying value for uniqueness
+        return ("TypeAliasType", type_alias.__name__, type_alias.__value__)
 
     # For generic aliases (list[int], dict[str, int], etc.)
     origin = typing.get_origin(type_alias)
@@ -1249,30 +1387,12 @@ def annotate_type_alias(type_alias, annotation_type, **kwargs):
     annotation_type, kwargs = _prepare_kwargs(annotation_type, kwargs, stacklevel=3)
     _warn_if_noop(annotation_type, stacklevel=3)
 
-    key = _normalize_type_alias_key(type_alias)
+    bucket, entry = _registry_entry(annotation_type, kwargs, "type alias annotation")
 
+    key = _normalize_type_alias_key(type_alias)
     if key not in _TYPE_ALIAS_ANNOTATION_REGISTRY:
         _TYPE_ALIAS_ANNOTATION_REGISTRY[key] = {"constraints": [], "directives": []}
-
-    registry = _TYPE_ALIAS_ANNOTATION_REGISTRY[key]
-
-    # Validate and add the annotation
-    if annotation_type in CONSTRAINT_TYPES:
-        validate_fields(annotation_type, kwargs, CONSTRAINT_TYPES[annotation_type])
-        entry = {annotation_type: kwargs}
-        registry["constraints"].append(entry)
-    elif annotation_type in DIRECTIVE_TYPES:
-        validate_fields(annotation_type, kwargs, DIRECTIVE_TYPES[annotation_type])
-        # Special handling for flag directives - store as scalar
-        if annotation_type == "flag" and "name" in kwargs:
-            entry = {annotation_type: kwargs["name"]}
-        else:
-            entry = {annotation_type: kwargs}
-        registry["directives"].append(entry)
-    else:
-        raise ValueError(
-            f"Unknown annotation type '{annotation_type}' for type alias annotation."
-        )
+    _TYPE_ALIAS_ANNOTATION_REGISTRY[key][bucket].append(entry)
 
     return type_alias
 
@@ -1328,10 +1448,11 @@ def reset_object_ids():
     annotations recorded for un-attributable objects, so existing selectors
     that depend on previous object IDs may no longer work.
     """
-    global _OBJECT_ID_COUNTER
-    _OBJECT_ID_COUNTER = 0
-    _OBJECT_ID_REGISTRY.clear()
-    _OBJECT_ANNOTATION_REGISTRY.clear()
+    global _next_object_id
+    with _OBJECT_STATE_LOCK:
+        _next_object_id = itertools.count(1).__next__
+        _OBJECT_ID_REGISTRY.clear()
+        _OBJECT_ANNOTATION_REGISTRY.clear()
 
     # Note: object ID / annotation *attributes* stored on attributable objects
     # are left intact; we can't enumerate them, so this clears the global
@@ -1344,34 +1465,45 @@ def _get_or_create_object_id(obj):
     :param obj: The object to get/create an ID for.
     :return: A unique string ID for the object.
     """
-    global _OBJECT_ID_COUNTER
-
-    # Try to get existing ID from the object directly
+    # Try to get existing ID from the object directly (one attribute lookup),
+    # then the global registry for objects that can't store attributes
     try:
-        if hasattr(obj, OBJECT_ID_ATTR):
-            return getattr(obj, OBJECT_ID_ATTR)
-    except (AttributeError, TypeError):
-        pass
-
-    # Check global registry for objects that can't store attributes
-    existing = _OBJECT_ID_REGISTRY.get(obj)
+        existing = getattr(obj, OBJECT_ID_ATTR, None)
+    except TypeError:
+        existing = None
+    if existing is None:
+        existing = _OBJECT_ID_REGISTRY.get(obj)
     if existing is not None:
         return existing
 
-    # Create new unique ID
-    _OBJECT_ID_COUNTER += 1
-    unique_id = f"obj_{_OBJECT_ID_COUNTER}"
+    with _OBJECT_STATE_LOCK:
+        # Another thread may have assigned one since the checks above.
+        try:
+            existing = getattr(obj, OBJECT_ID_ATTR, None)
+        except TypeError:
+            existing = None
+        if existing is None:
+            existing = _OBJECT_ID_REGISTRY.get(obj)
+        if existing is not None:
+            return existing
 
-    # Store the ID
-    try:
-        setattr(obj, OBJECT_ID_ATTR, unique_id)
-    except (AttributeError, TypeError):
-        # Object doesn't support attribute assignment, use global registry
-        _OBJECT_ID_REGISTRY.set(obj, unique_id)
+        # Create new unique ID
+        unique_id = f"obj_{_next_object_id()}"
+
+        # Store the ID
+        try:
+            setattr(obj, OBJECT_ID_ATTR, unique_id)
+        except (AttributeError, TypeError):
+            # Object doesn't support attribute assignment, use global registry
+            _OBJECT_ID_REGISTRY.set(obj, unique_id)
 
     return unique_id
 
 
+# The whole word 'self' in an object-level selector.
+_SELF_REFERENCE_RE = re.compile(r"\bself\b")
+
+
 def _process_selector_for_self_reference(selector, obj_id):
     """
     Process a selector string to replace 'self' references with the object's unique ID.
@@ -1379,11 +1511,13 @@ def _process_selector_for_self_reference(selector, obj_id):
     :param obj_id: The unique ID of the object being annotated.
     :return: The processed selector string.
     """
-    if selector is None:
+    if selector is None or "self" not in selector:
         return selector
 
-    # Replace all instances of the entire word 'self' with the object's unique ID
-    return re.sub(r"\bself\b", obj_id, selector)
+    # Replace all instances of the entire word 'self' with the object's unique
+    # ID. A callable replacement inserts the ID literally, so it is never
+    # read as a template with backslash escapes or group references.
+    return _SELF_REFERENCE_RE.sub(lambda _match: obj_id, selector)
 
 
 def validate_fields(type_, kwargs, valid_fields):
@@ -1392,75 +1526,74 @@ def validate_fields(type_, kwargs, valid_fields):
     For constraints that support multiple parameter sets (like group), try each set.
     :param type_: The type of constraint or directive.
     :param kwargs: The provided fields for the decorator.
-    :param valid_fields: The list of required fields for the type, or a list of alternative field sets.
+    :param valid_fields: The schema entry for the type: a ``CONSTRAINT_TYPES`` /
+        ``DIRECTIVE_TYPES`` value, or the list/dict shorthand they are written in.
     :raises ValueError: If no valid field set matches the provided kwargs.
     """
-    # Handle multiple alternatives (for group)
-    if (
-        isinstance(valid_fields, list)
-        and len(valid_fields) > 0
-        and isinstance(valid_fields[0], (list, dict))
-    ):
-        for field_set in valid_fields:
-            if isinstance(field_set, dict):
-                required = field_set.get("required", [])
-                optional = field_set.get("optional", [])
-            else:
-                required = field_set
-                optional = []
-
-            missing_fields = [field for field in required if field not in kwargs]
-            # Accept if all required fields are present
-            if not missing_fields:
-                # Optionally: check for unknown fields
-                all_valid_fields = required + optional
-                unknown_fields = [
-                    field for field in kwargs if field not in all_valid_fields
-                ]
-                if unknown_fields:
-                    print(
-                        f"Warning: Unknown fields for '{type_}': {', '.join(unknown_fields)}"
-                    )
-                return
-
-        # None matched - create error message
-        field_set_descriptions = []
-        for i, field_set in enumerate(valid_fields):
-            if isinstance(field_set, dict):
-                req = field_set.get("required", [])
-                opt = field_set.get("optional", [])
-                desc = (
-                    f"Set {i+1}: required: {', '.join(req)}; optional: {', '.join(opt)}"
-                )
-            else:
-                desc = f"Set {i+1}: {', '.join(field_set)}"
-            field_set_descriptions.append(desc)
-
-        raise ValueError(
-            f"No valid field set found for '{type_}'. "
-            f"Expected one of: {' OR '.join(field_set_descriptions)}. "
-            f"Provided: {', '.join(kwargs.keys())}"
-        )
+    # The module tables are already frozen; anything else is shorthand.
+    field_sets = valid_fields
+    if not (type(field_sets) is tuple and field_sets and type(field_sets[0]) is _FieldSet):
+        field_sets = _field_sets(valid_fields)
+    provided = kwargs.keys()
+    if len(field_sets) == 1:
+        field_set = field_sets[0]
+        if not provided >= field_set.needed:
+            missing_fields = [field for field in field_set.required if field not in kwargs]
+            raise ValueError(
+                f"Missing required fields for '{type_}': {', '.join(missing_fields)}"
+            )
     else:
-        # Single set (list or dict)
-        if isinstance(valid_fields, dict):
-            required = valid_fields.get("required", [])
-            optional = valid_fields.get("optional", [])
+        # Handle multiple alternatives (for group): accept the first set whose
+        # required fields are all present
+        for field_set in field_sets:
+            if provided >= field_set.needed:
+                break
         else:
-            required = valid_fields
-            optional = []
-
-        missing_fields = [field for field in required if field not in kwargs]
-        if missing_fields:
+            field_set_descriptions = [
+                f"Set {i+1}: required: {', '.join(fs.required)}; optional: {', '.join(fs.optional)}"
+                for i, fs in enumerate(field_sets)
+            ]
             raise ValueError(
-                f"Missing required fields for '{type_}': {', '.join(missing_fields)}"
+                f"No valid field set found for '{type_}'. "
+                f"Expected one of: {' OR '.join(field_set_descriptions)}. "
+                f"Provided: {', '.join(kwargs.keys())}"
             )
 
-        # Optionally: check for unknown fields
-        all_valid_fields = required + optional
-        unknown_fields = [field for field in kwargs if field not in all_valid_fields]
-        if unknown_fields:
-            print(f"Warning: Unknown fields for '{type_}': {', '.join(unknown_fields)}")
+    # Optionally: check for unknown fields
+    if not field_set.allowed >= provided:
+        unknown_fields = [field for field in kwargs if field not in field_set.allowed]
+        print(f"Warning: Unknown fields for '{type_}': {', '.join(unknown_fields)}")
+
+
+# annotation type -> (registry bucket, schema), so the three registration
+# paths share one lookup instead of each repeating the constraint/directive
+# ladder and the flag special case.
+_ENTRY_KINDS = MappingProxyType(
+    {
+        **{name: ("constraints", spec) for name, spec in CONSTRAINT_TYPES.items()},
+        **{name: ("directives", spec) for name, spec in DIRECTIVE_TYPES.items()},
+    }
+)
+
+
+def _registry_entry(annotation_type, kwargs, context):
+    """
+    Validate kwargs for an annotation and build its registry entry.
+    :param annotation_type: The type of constraint or directive.
+    :param kwargs: The annotation parameters.
+    :param context: What is being annotated, for the unknown-type error.
+    :return: ``(bucket, entry)`` where bucket is 'constraints' or 'directives'.
+    :raises ValueError: If the type is unknown or the fields don't validate.
+    """
+    kind = _ENTRY_KINDS.get(annotation_type)
+    if kind is None:
+        raise ValueError(f"Unknown annotation type '{annotation_type}' for {context}.")
+    bucket, field_sets = kind
+    validate_fields(annotation_type, kwargs, field_sets)
+    # Special handling for flag directives - store as scalar
+    if annotation_type == "flag" and "name" in kwargs:
+        return bucket, {annotation_type: kwargs["name"]}
+    return bucket, {annotation_type: kwargs}
 
 
 def _create_decorator(constraint_type, doc=None):
@@ -1493,32 +1626,13 @@ def _create_decorator(constraint_type, doc=None):
                 if "__spytial_registry__" not in target.__dict__:
                     # Create a new registry for this class
                     target.__spytial_registry__ = {"constraints": [], "directives": []}
+                # This class and any subclass may have cached decorators.
+                _CLASS_DECORATORS.clear()
 
-                # Determine if it's a constraint or directive
-                if effective_type in CONSTRAINT_TYPES:
-                    # Validate fields for constraints
-                    validate_fields(
-                        effective_type, kwargs, CONSTRAINT_TYPES[effective_type]
-                    )
-                    entry = {effective_type: kwargs}
-                    target.__spytial_registry__["constraints"].append(entry)
-                elif effective_type in DIRECTIVE_TYPES:
-                    # Validate fields for directives
-                    validate_fields(
-                        effective_type, kwargs, DIRECTIVE_TYPES[effective_type]
-                    )
-
-                    # Special handling for flag directives - store as scalar
-                    if effective_type == "flag" and "name" in kwargs:
-                        entry = {effective_type: kwargs["name"]}
-                    else:
-                        entry = {effective_type: kwargs}
-
-                    target.__spytial_registry__["directives"].append(entry)
-                else:
-                    raise ValueError(
-                        f"Unknown type '{effective_type}' for sPyTial decorator."
-                    )
+                bucket, entry = _registry_entry(
+                    effective_type, kwargs, "sPyTial decorator"
+                )
+                target.__spytial_registry__[bucket].append(entry)
 
                 return target
             else:
@@ -1924,15 +2038,24 @@ def _ensure_object_registry(obj):
     """
     # Try to store on the object directly first
     try:
-        if not hasattr(obj, OBJECT_ANNOTATIONS_ATTR):
-            setattr(obj, OBJECT_ANNOTATIONS_ATTR, {"constraints": [], "directives": []})
-        return getattr(obj, OBJECT_ANNOTATIONS_ATTR)
+        registry = getattr(obj, OBJECT_ANNOTATIONS_ATTR, None)
+        if registry is None:
+            with _OBJECT_STATE_LOCK:
+                registry = getattr(obj, OBJECT_ANNOTATIONS_ATTR, None)
+                if registry is None:
+                    registry = {"constraints": [], "directives": []}
+                    setattr(obj, OBJECT_ANNOTATIONS_ATTR, registry)
+        return registry
     except (AttributeError, TypeError):
         # Object doesn't support attribute assignment (e.g., built-in types)
         # Use the identity-keyed global registry instead.
-        return _OBJECT_ANNOTATION_REGISTRY.get_or_create(
-            obj, lambda: {"constraints": [], "directives": []}
-        )
+        registry = _OBJECT_ANNOTATION_REGISTRY.get(obj)
+        if registry is not None:
+            return registry
+        with _OBJECT_STATE_LOCK:
+            return _OBJECT_ANNOTATION_REGISTRY.get_or_create(
+                obj, lambda: {"constraints": [], "directives": []}
+            )
 
 
 def _annotate_object(obj, annotation_type, **kwargs):
@@ -1953,124 +2076,67 @@ def _annotate_object(obj, annotation_type, **kwargs):
     # Get or create unique ID for this object to enable self-reference
     obj_id = _get_or_create_object_id(obj)
 
-    # Process any selectors in kwargs to handle self-reference
-    processed_kwargs = kwargs.copy()
+    # Process any selectors in kwargs to handle self-reference. kwargs was
+    # built by this call's own ** unpacking, so it can be rewritten in place.
+    processed_kwargs = kwargs
     if "selector" in processed_kwargs:
         processed_kwargs["selector"] = _process_selector_for_self_reference(
             processed_kwargs["selector"], obj_id
         )
 
-    # Determine if it's a constraint or directive and validate
-    if annotation_type in CONSTRAINT_TYPES:
-        validate_fields(
-            annotation_type, processed_kwargs, CONSTRAINT_TYPES[annotation_type]
-        )
-        entry = {annotation_type: processed_kwargs}
-        registry["constraints"].append(entry)
-    elif annotation_type in DIRECTIVE_TYPES:
-        validate_fields(
-            annotation_type, processed_kwargs, DIRECTIVE_TYPES[annotation_type]
-        )
-
-        # Special handling for flag directives - store as scalar
-        if annotation_type == "flag" and "name" in processed_kwargs:
-            entry = {annotation_type: processed_kwargs["name"]}
-        else:
-            entry = {annotation_type: processed_kwargs}
-
-        registry["directives"].append(entry)
-    else:
-        raise ValueError(
-            f"Unknown annotation type '{annotation_type}' for object annotation."
-        )
+    bucket, entry = _registry_entry(
+        annotation_type, processed_kwargs, "object annotation"
+    )
+    registry[bucket].append(entry)
 
     return obj
 
 
 # Object-level annotation functions
-def annotate_orientation(obj, **kwargs):
-    """Apply orientation annotation to a specific object."""
-    return _annotate_object(obj, "orientation", **kwargs)
-
-
-def annotate_cyclic(obj, **kwargs):
-    """Apply cyclic annotation to a specific object."""
-    return _annotate_object(obj, "cyclic", **kwargs)
-
-
-def annotate_align(obj, **kwargs):
-    """Apply align annotation to a specific object."""
-    return _annotate_object(obj, "align", **kwargs)
-
-
-def annotate_group(obj, **kwargs):
-    """Apply group annotation to a specific object."""
-    return _annotate_object(obj, "group", **kwargs)
-
-
-def annotate_atomColor(obj, **kwargs):
-    """Apply atomColor annotation to a specific object (deprecated; use annotate_atomStyle)."""
-    return _annotate_object(obj, "atomColor", **kwargs)
-
-
-def annotate_atomStyle(obj, **kwargs):
-    """Apply atomStyle annotation to a specific object."""
-    return _annotate_object(obj, "atomStyle", **kwargs)
-
-
-def annotate_size(obj, **kwargs):
-    """Apply size annotation to a specific object."""
-    return _annotate_object(obj, "size", **kwargs)
-
-
-def annotate_icon(obj, **kwargs):
-    """Apply icon annotation to a specific object."""
-    return _annotate_object(obj, "icon", **kwargs)
-
-
-def annotate_edgeColor(obj, **kwargs):
-    """Apply edgeColor annotation to a specific object (deprecated; use annotate_edgeStyle)."""
-    return _annotate_object(obj, "edgeColor", **kwargs)
-
-
-def annotate_edgeStyle(obj, **kwargs):
-    """Apply edgeStyle annotation to a specific object."""
-    return _annotate_object(obj, "edgeStyle", **kwargs)
-
-
-def annotate_projection(obj, **kwargs):
-    """Apply projection annotation to a specific object."""
-    return _annotate_object(obj, "projection", **kwargs)
-
-
-def annotate_attribute(obj, **kwargs):
-    """Apply attribute annotation to a specific object."""
-    return _annotate_object(obj, "attribute", **kwargs)
-
-
-def annotate_hideField(obj, **kwargs):
-    """Apply hideField annotation to a specific object."""
-    return _annotate_object(obj, "hideField", **kwargs)
-
-
-def annotate_hideAtom(obj, **kwargs):
-    """Apply hideAtom annotation to a specific object."""
-    return _annotate_object(obj, "hideAtom", **kwargs)
-
-
-def annotate_inferredEdge(obj, **kwargs):
-    """Apply inferredEdge annotation to a specific object."""
-    return _annotate_object(obj, "inferredEdge", **kwargs)
+def _create_object_annotator(annotation_type, doc=None):
+    """
+    Create the ``annotate_<type>`` function for one constraint or directive type.
+    :param annotation_type: The type of annotation (e.g., 'cyclic', 'orientation').
+    :param doc: Docstring for the returned function; defaults to a one-liner.
+    :return: A function ``(obj, **kwargs)`` that annotates ``obj`` and returns it.
+    """
 
+    def annotator(obj, **kwargs):
+        return _annotate_object(obj, annotation_type, **kwargs)
 
-def annotate_tag(obj, **kwargs):
-    """Apply tag annotation to a specific object."""
-    return _annotate_object(obj, "tag", **kwargs)
+    annotator.__name__ = annotator.__qualname__ = f"annotate_{annotation_type}"
+    annotator.__doc__ = (
+        doc or f"Apply {annotation_type} annotation to a specific object."
+    )
+    return annotator
 
 
-def annotate_flag(obj, **kwargs):
-    """Apply flag annotation to a specific object."""
-    return _annotate_object(obj, "flag", **kwargs)
+# Spelled out rather than generated into globals() so static tools and IDEs
+# still see every name; test_decorator_docs checks this stays in step with
+# CONSTRAINT_TYPES/DIRECTIVE_TYPES.
+annotate_orientation = _create_object_annotator("orientation")
+annotate_cyclic = _create_object_annotator("cyclic")
+annotate_align = _create_object_annotator("align")
+annotate_group = _create_object_annotator("group")
+annotate_atomColor = _create_object_annotator(
+    "atomColor",
+    "Apply atomColor annotation to a specific object (deprecated; use annotate_atomStyle).",
+)
+annotate_atomStyle = _create_object_annotator("atomStyle")
+annotate_size = _create_object_annotator("size")
+annotate_icon = _create_object_annotator("icon")
+annotate_edgeColor = _create_object_annotator(
+    "edgeColor",
+    "Apply edgeColor annotation to a specific object (deprecated; use annotate_edgeStyle).",
+)
+annotate_edgeStyle = _create_object_annotator("edgeStyle")
+annotate_projection = _create_object_annotator("projection")
+annotate_attribute = _create_object_annotator("attribute")
+annotate_hideField = _create_object_annotator("hideField")
+annotate_hideAtom = _create_object_annotator("hideAtom")
+annotate_inferredEdge = _create_object_annotator("inferredEdge")
+annotate_tag = _create_object_annotator("tag")
+annotate_flag = _create_object_annotator("flag")
 
 
 # General purpose function for applying any annotation type
@@ -2186,57 +2252,89 @@ def _deduplicate_entries(entries):
     return unique
 
 
-def collect_decorators(obj, type_hint=None):
-    """
-    Collect all decorators applied to the class of the given object,
-    as well as any annotations applied directly to the object instance,
-    and any annotations registered for matching type aliases.
-    Respects inheritance control flags (dont_inherit_constraints, dont_inherit_directives).
-    :param obj: The object whose class decorators and object annotations should be collected.
-    :param type_hint: Optional type hint to look up type alias annotations.
-    :return: A combined dictionary of constraints and directives (deduplicated).
-    """
-    combined_registry = {"constraints": [], "directives": []}
+# Per class: the deduplicated (constraints, directives) its own registry and
+# its bases' contribute, with the inheritance control flags applied. Class
+# decorators are fixed once applied, so this is worked out once per class;
+# cleared whenever any class is decorated or has its inheritance flags set.
+_CLASS_DECORATORS = weakref.WeakKeyDictionary()
+
+
+def _class_decorators(cls):
+    """Return the class-level ``(constraints, directives)`` for ``cls``."""
+    try:
+        return _CLASS_DECORATORS[cls]
+    except KeyError:
+        pass
 
     # Check if current class has inheritance control flags
     should_inherit_constraints = not getattr(
-        obj.__class__, "__spytial_no_inherit_constraints__", False
+        cls, "__spytial_no_inherit_constraints__", False
     )
     should_inherit_directives = not getattr(
-        obj.__class__, "__spytial_no_inherit_directives__", False
+        cls, "__spytial_no_inherit_directives__", False
     )
 
-    # Traverse the class hierarchy
-    for i, cls in enumerate(obj.__class__.__mro__):
-        is_current_class = i == 0
+    constraints = []
+    directives = []
+    # Traverse the class hierarchy. Each class's own registry is read from its
+    # __dict__: hasattr/getattr would also find a base's registry through
+    # inheritance and re-add it under the subclass, bypassing the flags above.
+    for i, klass in enumerate(cls.__mro__):
+        cls_registry = klass.__dict__.get("__spytial_registry__")
+        if cls_registry is None:
+            continue
 
-        if hasattr(cls, "__spytial_registry__"):
-            cls_registry = cls.__spytial_registry__
+        if i == 0:
+            # For current class: include all from its registry
+            constraints.extend(cls_registry["constraints"])
+            directives.extend(cls_registry["directives"])
+        else:
+            # For parent classes: only include if inheritance is enabled
+            if should_inherit_constraints:
+                constraints.extend(cls_registry["constraints"])
 
-            if is_current_class:
-                # For current class: include all from its registry
-                combined_registry["constraints"].extend(cls_registry["constraints"])
-                combined_registry["directives"].extend(cls_registry["directives"])
-            else:
-                # For parent classes: only include if inheritance is enabled
-                if should_inherit_constraints:
-                    combined_registry["constraints"].extend(cls_registry["constraints"])
+            if should_inherit_directives:
+                directives.extend(cls_registry["directives"])
+
+    entry = (
+        tuple(_deduplicate_entries(constraints)),
+        tuple(_deduplicate_entries(directives)),
+    )
+    _CLASS_DECORATORS[cls] = entry
+    return entry
 
-                if should_inherit_directives:
-                    combined_registry["directives"].extend(cls_registry["directives"])
+
+def collect_decorators(obj, type_hint=None):
+    """
+    Collect all decorators applied to the class of the given object,
+    as well as any annotations applied directly to the object instance,
+    and any annotations registered for matching type aliases.
+    Respects inheritance control flags (dont_inherit_constraints, dont_inherit_directives).
+    :param obj: The object whose class decorators and object annotations should be collected.
+    :param type_hint: Optional type hint to look up type alias annotations.
+    :return: A combined dictionary of constraints and directives (deduplicated).
+    """
+    class_constraints, class_directives = _class_decorators(obj.__class__)
+    combined_registry = {
+        "constraints": list(class_constraints),
+        "directives": list(class_directives),
+    }
+    per_object = False
 
     # Add object-level annotations if they exist
     # First check if stored on object directly
-    if hasattr(obj, OBJECT_ANNOTATIONS_ATTR):
-        object_registry = getattr(obj, OBJECT_ANNOTATIONS_ATTR)
+    object_registry = getattr(obj, OBJECT_ANNOTATIONS_ATTR, None)
+    if object_registry is not None:
         combined_registry["constraints"].extend(object_registry["constraints"])
         combined_registry["directives"].extend(object_registry["directives"])
+        per_object = True
 
     # Then check global registry for objects that can't store attributes
     object_registry = _OBJECT_ANNOTATION_REGISTRY.get(obj)
     if object_registry is not None:
         combined_registry["constraints"].extend(object_registry["constraints"])
         combined_registry["directives"].extend(object_registry["directives"])
+        per_object = True
 
     # Check for type alias annotations if a type hint was provided
     if type_hint is not None:
@@ -2246,6 +2344,13 @@ def collect_decorators(obj, type_hint=None):
                 type_alias_annotations["constraints"]
             )
             combined_registry["directives"].extend(type_alias_annotations["directives"])
+            per_object = True
+
+    if not per_object:
+        # Only class-level entries, which are already deduplicated.
+        if class_directives:
+            _warn_style_conflicts(combined_registry["directives"])
+        return combined_registry
 
     # Deduplicate entries to avoid excessive redundant YAML rules
     combined_registry["constraints"] = _deduplicate_entries(
@@ -2262,13 +2367,75 @@ def collect_decorators(obj, type_hint=None):
     return combined_registry
 
 
+def _dump_spec_yaml(decorators):
+    import yaml
+
+    return yaml.dump(decorators, default_flow_style=False, Dumper=_no_alias_dumper())
+
+
+# Serialized specs keyed by a canonical JSON rendering of the decorators.
+# Class-level decorators are fixed once the class is defined, so repeated
+# diagram() calls over the same types keep producing the same spec.
+_YAML_SPEC_CACHE: dict = {}
+_YAML_SPEC_CACHE_MAX = 256
+
+
 def serialize_to_yaml_string(decorators):
     """
     Serialize the collected constraints and directives to a YAML string.
     :param decorators: The collected decorators (constraints and directives).
     :return: YAML string representation of the decorators.
     """
-    return yaml.dump(decorators, default_flow_style=False, Dumper=NoAliasDumper)
+    # json.dumps would render {1: x} and {"1": x} alike; YAML keeps them apart.
+    if not _has_only_str_keys(decorators):
+        return _dump_spec_yaml(decorators)
+    try:
+        # yaml.dump sorts mapping keys, so sort_keys here cannot conflate two
+        # inputs that would serialize differently.
+        key = json.dumps(decorators, sort_keys=True)
+    except (TypeError, ValueError):
+        # Not JSON-shaped (custom objects): skip the cache.
+        return _dump_spec_yaml(decorators)
+
+    cached = _YAML_SPEC_CACHE.get(key)
+    if cached is None:
+        cached = _dump_spec_yaml(decorators)
+        if len(_YAML_SPEC_CACHE) >= _YAML_SPEC_CACHE_MAX:
+            _YAML_SPEC_CACHE.clear()
+        _YAML_SPEC_CACHE[key] = cached
+    return cached
+
+
+def _has_only_str_keys(value):
+    """Whether every mapping nested in ``value`` is keyed by strings only."""
+    if isinstance(value, dict):
+        return all(
+            type(k) is str and _has_only_str_keys(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return all(_has_only_str_keys(item) for item in value)
+    return True
+
+
+def serialize_to_json_string(decorators):
+    """
+    Serialize the collected constraints and directives to a JSON string.
+
+    This is the form embedded in the rendered diagrams: spytial-core reads the
+    spec with a YAML parser, and JSON is a subset of YAML, so it accepts this
+    as-is while skipping the YAML emitter entirely. Uses ``orjson`` when
+    installed. Specs that are not JSON-shaped, including any with non-string
+    mapping keys, fall back to :func:`serialize_to_yaml_string`.
+    :param decorators: The collected decorators (constraints and directives).
+    :return: JSON string representation of the decorators.
+    """
+    if not _has_only_str_keys(decorators):
+        # json.dumps would silently turn e.g. int keys into strings.
+        return serialize_to_yaml_string(decorators)
+    try:
+        return dumps_embedded_json(decorators)
+    except (TypeError, ValueError):
+        return serialize_to_yaml_string(decorators)
 
 
 # Inheritance Control
@@ -2295,6 +2462,7 @@ def dont_inherit_constraints(cls):
     :return: The class (for chaining).
     """
     cls.__spytial_no_inherit_constraints__ = True
+    _CLASS_DECORATORS.clear()
     return cls
 
 
@@ -2319,6 +2487,7 @@ def dont_inherit_directives(cls):
     :return: The class (for chaining).
     """
     cls.__spytial_no_inherit_directives__ = True
+    _CLASS_DECORATORS.clear()
     return cls
 
 
@@ -2344,11 +2513,88 @@ def dont_inherit_annotations(cls):
     """
     cls.__spytial_no_inherit_constraints__ = True
     cls.__spytial_no_inherit_directives__ = True
+    _CLASS_DECORATORS.clear()
     return cls
 
 
-# Export apply_if in module __all__
 __all__ = [
-    # ...other exports...
+    # Class decorators (for decorating classes)
+    "orientation",
+    "cyclic",
+    "align",
+    "group",
+    "atomColor",
+    "atomStyle",
+    "size",
+    "icon",
+    "edgeColor",
+    "edgeStyle",
+    "projection",
+    "attribute",
+    "hideField",
+    "hideAtom",
+    "inferredEdge",
+    "tag",
+    "flag",
+    # Style blocks (spytial-core 3.0 style system)
+    "LineStyle",
+    "TextStyle",
+    "BorderStyle",
+    "FillStyle",
+    "GroupEdge",
+    # Object annotation functions
+    "annotate",
+    "annotate_orientation",
+    "annotate_cyclic",
+    "annotate_align",
+    "annotate_group",
+    "annotate_atomColor",
+    "annotate_atomStyle",
+    "annotate_size",
+    "annotate_icon",
+    "annotate_edgeColor",
+    "annotate_edgeStyle",
+    "annotate_projection",
+    "annotate_attribute",
+    "annotate_hideField",
+    "annotate_hideAtom",
+    "annotate_inferredEdge",
+    "annotate_tag",
+    "annotate_flag",
+    # Type alias annotation classes (for use with typing.Annotated)
+    "SpytialAnnotation",
+    "Orientation",
+    "Cyclic",
+    "Align",
+    "Group",
+    "AtomColor",
+    "AtomStyle",
+    "Size",
+    "Icon",
+    "EdgeColor",
+    "EdgeStyle",
+    "HideField",
+    "HideAtom",
+    "Projection",
+    "Attribute",
+    "InferredEdge",
+    "Tag",
+    "Flag",
+    "extract_spytial_annotations",
+    "get_base_type",
+    # Legacy type alias functions (prefer using typing.Annotated instead)
+    "annotate_type_alias",
+    "get_type_alias_annotations",
+    "clear_type_alias_annotations",
+    "list_type_alias_annotations",
+    # Inheritance control decorators
+    "dont_inherit_constraints",
+    "dont_inherit_directives",
+    "dont_inherit_annotations",
+    # Utility functions
+    "collect_decorators",
+    "serialize_to_yaml_string",
+    "serialize_to_json_string",
+    "reset_object_ids",
     "apply_if",
 ]
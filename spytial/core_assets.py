@@ -1,5 +1,7 @@
 """Shared spytial-core browser asset definitions for HTML templates."""
 
+from pathlib import Path
+
 SPYTIAL_CORE_VERSION = "4.0.0"
 
 _CDN_BASE = f"https://cdn.jsdelivr.net/npm/spytial-core@{SPYTIAL_CORE_VERSION}"
@@ -28,3 +30,47 @@ def get_template_asset_context():
         "spytial_core_components_bundle_url": SPYTIAL_CORE_COMPONENTS_BUNDLE_URL,
         "spytial_core_components_css_url": SPYTIAL_CORE_COMPONENTS_CSS_URL,
     }
+
+
+# Built on first use and kept for the process: Jinja2 caches each compiled
+# template on its Environment, and auto_reload=False skips the per-render
+# mtime check on the packaged template files, which never change at runtime.
+_TEMPLATE_ENV = None
+
+
+def _bytecode_cache():
+    """Return a Jinja2 bytecode cache shared across processes, or ``None``.
+
+    Compiling a page template costs several milliseconds on the first render
+    in every new interpreter; the cache keeps the compiled code in a private
+    per-user directory under the system temp dir, keyed by the template's
+    source checksum, so a changed template is simply recompiled. Caching is
+    best effort: no usable temp dir or a failed write just means compiling.
+    """
+    from jinja2 import FileSystemBytecodeCache
+
+    class _BestEffortBytecodeCache(FileSystemBytecodeCache):
+        def dump_bytecode(self, bucket):
+            try:
+                super().dump_bytecode(bucket)
+            except OSError:
+                pass
+
+    try:
+        return _BestEffortBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+def get_template(name: str):
+    """Return the compiled package HTML template *name*. Requires Jinja2."""
+    global _TEMPLATE_ENV
+    if _TEMPLATE_ENV is None:
+        from jinja2 import Environment, FileSystemLoader
+
+        _TEMPLATE_ENV = Environment(
+            loader=FileSystemLoader(Path(__file__).parent),
+            auto_reload=False,
+            bytecode_cache=_bytecode_cache(),
+        )
+    return _TEMPLATE_ENV.get_template(name)
@@ -8,9 +8,28 @@ that form the foundation of the relationalizer architecture.
 import abc
 import dataclasses
 import inspect
-from typing import Any, Dict, List, Tuple, Optional
+import sys
+from typing import Any, Dict, List, Optional, Tuple
 
 
+def _slotted(cls):
+    """Rebuild dataclass ``cls`` with ``__slots__`` for its fields.
+
+    A build emits an Atom per object and a Relation per edge, so dropping the
+    per-instance ``__dict__`` matters on large graphs. This is the rebuild
+    ``dataclass(slots=True)`` performs, which needs Python 3.10.
+    """
+    names = tuple(f.name for f in dataclasses.fields(cls))
+    body = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    body["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, body)
+
+
+@_slotted
 @dataclasses.dataclass
 class Atom:
     """
@@ -29,6 +48,12 @@ class Atom:
     # matching the existing __module__/__qualname__ convention set by _walk.
     meta: Optional[Dict[str, str]] = None
 
+    def __post_init__(self):
+        # A handful of type names recur across every atom of a build; share
+        # one string object per name.
+        if type(self.type) is str:
+            self.type = sys.intern(self.type)
+
     def to_dict(self) -> Dict[str, str]:
         """Convert atom to dictionary format expected by CnD."""
         d = {"id": self.id, "type": self.type, "label": self.label}
@@ -37,6 +62,7 @@ class Atom:
         return d
 
 
+@_slotted
 @dataclasses.dataclass
 class Relation:
     """
@@ -53,6 +79,10 @@ class Relation:
         """Validate that relation connects at least 2 atoms."""
         if len(self.atoms) < 2:
             raise ValueError("Relations must connect at least 2 atoms")
+        # Relation names key the builder's relation tables and repeat on every
+        # edge, so share one string object per name.
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
 
     def to_tuple(self) -> Tuple[str, ...]:
         """Convert relation to tuple format.
@@ -73,6 +103,17 @@ class RelationalizerBase(abc.ABC):
     relationships between objects are expressed as spatial relations.
     """
 
+    #: True when :meth:`relationalize` always emits ``walker_func._get_id(obj)``
+    #: as its first atom. The builder can then hand that id to the parent
+    #: straight away and visit the object later from its worklist; otherwise
+    #: the object is walked eagerly, on the caller's stack.
+    walker_assigns_primary_id: bool = False
+
+    #: True when :meth:`can_handle` depends only on ``type(obj)``. The registry
+    #: then remembers its dispatch decision per type instead of asking every
+    #: relationalizer again for each object.
+    handles_by_type: bool = False
+
     @abc.abstractmethod
     def can_handle(self, obj: Any) -> bool:
         """
@@ -1,13 +1,30 @@
 """Relationalizer for dataclass objects."""
 
 import dataclasses
+import weakref
 from typing import Any, List, Tuple
 from .base import RelationalizerBase, Atom, Relation
 
+# cls -> its dataclass field names, computed once per class.
+_FIELD_NAMES: "weakref.WeakKeyDictionary[type, Tuple[str, ...]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+    try:
+        return _FIELD_NAMES[cls]
+    except KeyError:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in dataclasses.fields(cls))
+        return names
+
 
 class DataclassRelationalizer(RelationalizerBase):
     """Handles dataclass objects."""
 
+    walker_assigns_primary_id = True
+    handles_by_type = True
+
     def can_handle(self, obj: Any) -> bool:
         return dataclasses.is_dataclass(obj)
 
@@ -32,9 +49,8 @@ class DataclassRelationalizer(RelationalizerBase):
         # instance's real value. Hiding a field is a display decision, so it
         # belongs in a directive rather than here.
         relations = []
-        for field in dataclasses.fields(obj):
-            value = getattr(obj, field.name)
-            vid = walker_func(value)
-            relations.append(Relation(field.name, [obj_id, vid]))
+        for name in _field_names(type(obj)):
+            vid = walker_func(getattr(obj, name))
+            relations.append(Relation(name, [obj_id, vid]))
 
         return [atom], relations
@@ -1,5 +1,6 @@
 """Relationalizer for dictionary objects."""
 
+from itertools import chain
 from typing import Any, List, Tuple
 from .base import RelationalizerBase, Atom, Relation
 
@@ -7,6 +8,9 @@ from .base import RelationalizerBase, Atom, Relation
 class DictRelationalizer(RelationalizerBase):
     """Handles dictionary objects."""
 
+    walker_assigns_primary_id = True
+    handles_by_type = True
+
     def can_handle(self, obj: Any) -> bool:
         return isinstance(obj, dict)
 
@@ -20,20 +24,17 @@ class DictRelationalizer(RelationalizerBase):
 
         atoms = [Atom(id=obj_id, type=typ, label=label)]
         relations = []
-        for k, v in obj.items():
-            # Walk every key through the normal pipeline — primitives *and*
-            # complex keys (tuples, objects, …). _walk records the key's own
-            # atom plus, for containers/objects, its nested structure and class
-            # identity, which reify needs to rebuild the real key. A previous
-            # shortcut emitted a synthetic, un-walked atom for non-primitive
-            # keys, so they reified to empty shells (e.g. {('a','b'): 1} came
-            # back as {(): 1}). Memoization also means a key object that appears
-            # elsewhere now shares one atom instead of being duplicated.
-            key_id = walker_func._walk(k)
-
-            # Get the value ID
-            vid = walker_func._walk(v)
-
+        # Walk every key through the normal pipeline — primitives *and*
+        # complex keys (tuples, objects, …). _walk records the key's own
+        # atom plus, for containers/objects, its nested structure and class
+        # identity, which reify needs to rebuild the real key. A previous
+        # shortcut emitted a synthetic, un-walked atom for non-primitive
+        # keys, so they reified to empty shells (e.g. {('a','b'): 1} came
+        # back as {(): 1}). Memoization also means a key object that appears
+        # elsewhere now shares one atom instead of being duplicated.
+        # Keys and values are walked in one run, alternating as in items().
+        ids = iter(walker_func._walk_all(chain.from_iterable(obj.items())))
+        for key_id, vid in zip(ids, ids):
             # Create a ternary relation: keyval(dict, key, value)
             relations.append(Relation("kv", [obj_id, key_id, vid]))
 
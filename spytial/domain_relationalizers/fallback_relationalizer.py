@@ -7,6 +7,9 @@ from .base import RelationalizerBase, Atom, Relation
 class FallbackRelationalizer(RelationalizerBase):
     """Fallback relationalizer for objects that can't be handled by other relationalizers."""
 
+    walker_assigns_primary_id = True
+    handles_by_type = True
+
     def can_handle(self, obj: Any) -> bool:
         return True  # Always accepts
 
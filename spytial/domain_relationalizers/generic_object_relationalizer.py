@@ -12,13 +12,134 @@ Design Decisions:
 """
 
 import inspect
-from typing import Any, List, Tuple
+import types
+import weakref
+from typing import Any, List, Optional, Tuple
 from .base import RelationalizerBase, Atom, Relation
 
+# cls -> public names from dir(cls) that are not plain methods. This depends
+# only on the class, so it is worked out once per class rather than by
+# dir()/getattr on every instance.
+_CLASS_MEMBERS: "weakref.WeakKeyDictionary[type, Optional[Tuple[str, ...]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# cls -> (key order of the last instance __dict__ seen, the member names it
+# yielded). Instances of one class nearly always share a __dict__ layout, so
+# the merge with the class names and the sort are skipped after the first.
+_INSTANCE_LAYOUTS: "weakref.WeakKeyDictionary[type, Tuple[tuple, Tuple[str, ...]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# Member values that are behaviour rather than data: exactly what
+# inspect.ismethod/isfunction/ismodule/isbuiltin accept, as one isinstance.
+_SKIPPED_VALUE_TYPES = (
+    types.MethodType,
+    types.FunctionType,
+    types.ModuleType,
+    types.BuiltinFunctionType,  # Catch built-in methods
+)
+
+
+def _is_method_attribute(attr: Any) -> bool:
+    """True if a class-level attribute reads back as a method or function on
+    an instance, so the member filter below would skip it anyway."""
+    if isinstance(attr, (types.FunctionType, classmethod)):
+        return True
+    if isinstance(attr, staticmethod):
+        return inspect.isfunction(attr.__func__) or inspect.isbuiltin(attr.__func__)
+    return False
+
+
+def _class_members(cls: type) -> Optional[Tuple[str, ...]]:
+    """Public, non-method member names of ``cls``, or None when the class
+    customises attribute lookup and needs the slow path."""
+    try:
+        return _CLASS_MEMBERS[cls]
+    except KeyError:
+        pass
+    if (
+        cls.__dir__ is not object.__dir__
+        or cls.__getattribute__ is not object.__getattribute__
+    ):
+        members = None
+    else:
+        members = []
+        for name in dir(cls):
+            if name[:1] == "_":
+                continue
+            for klass in cls.__mro__:
+                if name in klass.__dict__:
+                    if not _is_method_attribute(klass.__dict__[name]):
+                        members.append(name)
+                    break
+            else:
+                members.append(name)
+        members = tuple(members)
+    try:
+        _CLASS_MEMBERS[cls] = members
+    except TypeError:
+        pass
+    return members
+
+
+def _member_names(cls: type, class_names: Tuple[str, ...], instance_dict: dict):
+    """Sorted union of ``class_names`` and the public keys of ``instance_dict``.
+
+    Instance attributes shadow class-level methods of the same name, so they
+    are added back even when the class lists that name as a method.
+    """
+    layout = tuple(instance_dict)
+    cached = _INSTANCE_LAYOUTS.get(cls)
+    if cached is not None and cached[0] == layout:
+        return cached[1]
+    names = tuple(
+        sorted(
+            set(class_names).union(
+                name for name in layout if isinstance(name, str) and name[:1] != "_"
+            )
+        )
+    )
+    try:
+        _INSTANCE_LAYOUTS[cls] = (layout, names)
+    except TypeError:
+        pass
+    return names
+
+
+def _getmembers(obj: Any) -> List[Tuple[str, Any]]:
+    """``inspect.getmembers(obj)`` restricted to public, non-method names.
+
+    Methods are dropped by name using the per-class cache, so they are never
+    bound; the remaining names are fetched exactly as getmembers would.
+    """
+    cls = type(obj)
+    class_names = _class_members(cls)
+    if class_names is None:
+        return [
+            (name, value) for name, value in inspect.getmembers(obj) if name[:1] != "_"
+        ]
+    instance_dict = getattr(obj, "__dict__", None)
+    if isinstance(instance_dict, dict) and instance_dict:
+        names = _member_names(cls, class_names, instance_dict)
+    else:
+        names = class_names
+    result = []
+    for name in names:
+        try:
+            result.append((name, getattr(obj, name)))
+        except AttributeError:
+            continue
+    return result
+
 
 class GenericObjectRelationalizer(RelationalizerBase):
     """Handles generic objects with __dict__ or __slots__."""
 
+    walker_assigns_primary_id = True
+    handles_by_type = True
+
     def can_handle(self, obj: Any) -> bool:
         # Handle objects with __dict__, __slots__, or any class-based object (excluding built-ins handled elsewhere)
         return (
@@ -43,16 +164,10 @@ class GenericObjectRelationalizer(RelationalizerBase):
 
         relations = []
 
-        # Use inspect to get all members, filtering for relevant attributes
-        for name, value in inspect.getmembers(obj):
-            # Skip private attributes, methods, functions, modules, and built-ins
-            if (
-                name.startswith("_")
-                or inspect.ismethod(value)
-                or inspect.isfunction(value)
-                or inspect.ismodule(value)
-                or inspect.isbuiltin(value)  # Catch built-in methods
-            ):
+        # Get all public members, filtering for relevant attributes
+        for name, value in _getmembers(obj):
+            # Skip methods, functions, modules, and built-ins
+            if isinstance(value, _SKIPPED_VALUE_TYPES):
                 continue
 
             # Handle properties and descriptors by evaluating on the instance
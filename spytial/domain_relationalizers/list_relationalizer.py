@@ -3,10 +3,16 @@
 from typing import Any, List, Tuple
 from .base import RelationalizerBase, Atom, Relation
 
+# Index atom labels for short lists, so they aren't re-stringified per element.
+_INDEX_LABELS = tuple(str(i) for i in range(256))
+
 
 class ListRelationalizer(RelationalizerBase):
     """Handles list objects."""
 
+    walker_assigns_primary_id = True
+    handles_by_type = True
+
     def can_handle(self, obj: Any) -> bool:
         return isinstance(obj, list)
 
@@ -17,18 +23,16 @@ class ListRelationalizer(RelationalizerBase):
 
         atoms = [atom]
         relations = []
-        for i, elt in enumerate(obj):
+        for i, eid in enumerate(walker_func._walk_all(obj)):
             # Create an atom for the index
             idx_id = walker_func._get_id(i)
 
             # Wait, only create the atom for the index if it's not already created?
 
-            idx_atom = Atom(id=idx_id, type="int", label=str(i))
+            label = _INDEX_LABELS[i] if i < 256 else str(i)
+            idx_atom = Atom(id=idx_id, type="int", label=label)
             atoms.append(idx_atom)
 
-            # Get the element ID
-            eid = walker_func(elt)
-
             # Create a ternary relation: idx(list, index, element)
             relations.append(Relation("idx", [obj_id, idx_id, eid]))
 
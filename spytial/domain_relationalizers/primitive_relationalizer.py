@@ -8,6 +8,9 @@ class PrimitiveRelationalizer(RelationalizerBase):
     """Handles primitive leaf types: int, float, complex, str, bytes,
     bytearray, bool, None, NotImplemented, and Ellipsis."""
 
+    walker_assigns_primary_id = True
+    handles_by_type = True
+
     def can_handle(self, obj: Any) -> bool:
         return (
             isinstance(
@@ -7,6 +7,9 @@ from .base import RelationalizerBase, Atom, Relation
 class RangeRelationalizer(RelationalizerBase):
     """Handles range objects as start/stop/step structure."""
 
+    walker_assigns_primary_id = True
+    handles_by_type = True
+
     def can_handle(self, obj: Any) -> bool:
         return isinstance(obj, range)
 
@@ -67,6 +67,9 @@ class EnumRelationalizer(RelationalizerBase):
     atom's own ``__module__``/``__qualname__`` resolve to.
     """
 
+    walker_assigns_primary_id = True
+    handles_by_type = True
+
     def can_handle(self, obj: Any) -> bool:
         return isinstance(obj, enum.Enum)
 
@@ -96,6 +99,9 @@ class FunctionRelationalizer(RelationalizerBase):
     bound method.
     """
 
+    walker_assigns_primary_id = True
+    handles_by_type = True
+
     def can_handle(self, obj: Any) -> bool:
         return inspect.isfunction(obj) or inspect.isbuiltin(obj)
 
@@ -112,6 +118,9 @@ class FunctionRelationalizer(RelationalizerBase):
 class TypeRelationalizer(RelationalizerBase):
     """Handles class objects as importable references."""
 
+    walker_assigns_primary_id = True
+    handles_by_type = True
+
     def can_handle(self, obj: Any) -> bool:
         return isinstance(obj, type)
 
@@ -128,6 +137,9 @@ class TypeRelationalizer(RelationalizerBase):
 class ModuleRelationalizer(RelationalizerBase):
     """Handles modules as importable references."""
 
+    walker_assigns_primary_id = True
+    handles_by_type = True
+
     def can_handle(self, obj: Any) -> bool:
         return inspect.ismodule(obj)
 
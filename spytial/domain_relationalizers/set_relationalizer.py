@@ -7,6 +7,9 @@ from .base import RelationalizerBase, Atom, Relation
 class SetRelationalizer(RelationalizerBase):
     """Handles set-like objects (set and frozenset)."""
 
+    walker_assigns_primary_id = True
+    handles_by_type = True
+
     def can_handle(self, obj: Any) -> bool:
         return isinstance(obj, (set, frozenset))
 
@@ -19,9 +22,9 @@ class SetRelationalizer(RelationalizerBase):
         )
         atom = Atom(id=obj_id, type=typ, label=label)
 
-        relations = []
-        for element in obj:
-            element_id = walker_func(element)
-            relations.append(Relation("contains", [obj_id, element_id]))
+        relations = [
+            Relation("contains", [obj_id, element_id])
+            for element_id in walker_func._walk_all(obj)
+        ]
 
         return [atom], relations
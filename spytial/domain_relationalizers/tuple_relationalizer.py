@@ -1,10 +1,18 @@
+import sys
 from typing import Any, List, Tuple
 from .base import RelationalizerBase, Atom, Relation
 
+# Relation names for the first positions, built once and interned so every
+# tuple shares the same key objects in the builder's relation tables.
+_POSITION_NAMES = tuple(sys.intern(f"t{i}") for i in range(256))
+
 
 class TupleRelationalizer(RelationalizerBase):
     """Handles list and tuple objects."""
 
+    walker_assigns_primary_id = True
+    handles_by_type = True
+
     def can_handle(self, obj: Any) -> bool:
         return isinstance(obj, (tuple))
 
@@ -19,13 +27,8 @@ class TupleRelationalizer(RelationalizerBase):
 
         atoms = [atom]
         relations = []
-        for i, elt in enumerate(obj):
-
-            # Wait, only create the atom for the index if it's not already created?
-
-            # Get the element ID
-            eid = walker_func(elt)
-
-            relations.append(Relation(f"t{i}", [obj_id, eid]))
+        for i, eid in enumerate(walker_func._walk_all(obj)):
+            name = _POSITION_NAMES[i] if i < 256 else f"t{i}"
+            relations.append(Relation(name, [obj_id, eid]))
 
         return atoms, relations
@@ -4,29 +4,21 @@ sPyTial Evaluator Module
 This module provides functions to evaluate expressions using the sPyTial evaluator.
 """
 
-import json
 import tempfile
 import webbrowser
 from pathlib import Path
 import os
 from typing import Any, Optional
 
-from .utils import is_notebook, default_method
-from .core_assets import get_template_asset_context
-
-try:
-    from IPython.display import display, HTML
-
-    HAS_IPYTHON = True
-except ImportError:
-    HAS_IPYTHON = False
-
-try:
-    from jinja2 import Environment, FileSystemLoader
-
-    HAS_JINJA2 = True
-except ImportError:
-    HAS_JINJA2 = False
+from .utils import (
+    HAS_IPYTHON,
+    HAS_JINJA2,
+    is_notebook,
+    default_method,
+    dumps_embedded_json,
+    inline_iframe_html,
+)
+from .core_assets import get_template, get_template_asset_context
 
 
 def evaluate(
@@ -80,26 +72,9 @@ def evaluate(
         # Display inline in Jupyter notebook using iframe
         if HAS_IPYTHON:
             try:
-                import base64
-
-                # Encode HTML as base64 for iframe
-                encoded_html = base64.b64encode(html_content.encode("utf-8")).decode(
-                    "utf-8"
-                )
-
-                # Create iframe HTML
-                iframe_html = f"""
-                <div style="border: 2px solid #007acc; border-radius: 8px; overflow: hidden;">
-                    <iframe 
-                        src="data:text/html;base64,{encoded_html}" 
-                        width="100%" 
-                        height="{height}px" 
-                        frameborder="0"
-                        style="display: block;">
-                    </iframe>
-                </div>
-                """
+                from IPython.display import display, HTML
 
+                iframe_html = inline_iframe_html(html_content, height)
                 display(HTML(iframe_html))
                 return
 
@@ -162,12 +137,10 @@ def _generate_evaluator_html(data_instance, width=800, height=600):
             "Jinja2 is required for HTML generation. Install with: pip install jinja2"
         )
 
-    # Set up Jinja2 environment
     current_dir = Path(__file__).parent
-    env = Environment(loader=FileSystemLoader(current_dir))
 
     try:
-        template = env.get_template("evaluator_template.html")
+        template = get_template("evaluator_template.html")
     except Exception as e:
         raise FileNotFoundError(
             f"evaluator_template.html not found in {current_dir}: {e}"
@@ -175,7 +148,7 @@ def _generate_evaluator_html(data_instance, width=800, height=600):
 
     # Render the template with our data
     html_content = template.render(
-        python_data=json.dumps(data_instance),  # Properly serialize to JSON
+        python_data=dumps_embedded_json(data_instance),  # Properly serialize to JSON
         width=width,  # Container width
         height=height,  # Container height
         **get_template_asset_context(),
@@ -6,15 +6,50 @@ into CnD-compatible atom/relation representations using relationalizers.
 """
 
 import ast
+import dataclasses
 import enum
+import functools
 import importlib
 import inspect
 import sys
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from .annotations import (
+    OBJECT_ID_ATTR,
+    _OBJECT_ANNOTATION_REGISTRY,
+    _OBJECT_ID_REGISTRY,
+    _deduplicate_entries,
+    collect_decorators,
+    extract_spytial_annotations,
+)
 
 # Import base classes from domain-relationalizers
 from .domain_relationalizers.base import RelationalizerBase, Atom, Relation
 
+# One level of eager walk nesting costs 3-4 Python stack frames (measured: 3
+# for dicts, 4 for lists and dataclasses). Dividing the interpreter's frame
+# budget by 8 leaves roughly a 2x margin for the caller's own stack. Floored at
+# the historical fixed limit of 100, and capped because a deliberately huge
+# recursionlimit can outrun the actual C stack.
+_FRAMES_PER_LEVEL = 8
+_MIN_WALK_DEPTH = 100
+_MAX_WALK_DEPTH = 1000
+
+
+def default_max_depth() -> int:
+    """Deepest nesting :meth:`CnDDataInstanceBuilder._walk` follows on the stack.
+
+    Derived from ``sys.getrecursionlimit()`` at call time, so raising the
+    interpreter's limit raises this too: 125 on a stock CPython (limit 1000),
+    375 at a limit of 3000. Objects nested deeper than this are no longer an
+    error; the walk carries on from a worklist instead of recursing.
+    """
+    return max(
+        _MIN_WALK_DEPTH,
+        min(_MAX_WALK_DEPTH, sys.getrecursionlimit() // _FRAMES_PER_LEVEL),
+    )
+
 
 def _invoke_custom_reifier(fn, atom, relations, reify_atom, register):
     """Call a user-registered reifier, passing ``register`` only if it accepts it.
@@ -47,32 +82,6 @@ def _invoke_custom_reifier(fn, atom, relations, reify_atom, register):
     return fn(atom, relations, reify_atom)
 
 
-# One level of walk nesting costs 3-4 Python stack frames (measured: 3 for
-# dicts, 4 for lists and dataclasses). Dividing the interpreter's frame budget
-# by 8 leaves roughly a 2x margin for the caller's own stack, so the walker's
-# own guard always trips before CPython's — the former raises one clean error,
-# the latter unwinds thousands of frames. Floored so this never allows less
-# than the historical fixed limit of 100, and capped because a deliberately
-# huge recursionlimit can outrun the actual C stack.
-_FRAMES_PER_LEVEL = 8
-_MIN_WALK_DEPTH = 100
-_MAX_WALK_DEPTH = 1000
-
-
-def default_max_depth() -> int:
-    """Deepest nesting :meth:`CnDDataInstanceBuilder._walk` will follow.
-
-    Derived from ``sys.getrecursionlimit()`` at call time, so raising the
-    interpreter's limit raises this too: 100 on a stock CPython (limit 1000),
-    375 at a limit of 3000. Tracked for removal in sidprasad/spytial#131,
-    which makes the walk iterative and drops the ceiling entirely.
-    """
-    return max(
-        _MIN_WALK_DEPTH,
-        min(_MAX_WALK_DEPTH, sys.getrecursionlimit() // _FRAMES_PER_LEVEL),
-    )
-
-
 def _resolve_named(module_name: Optional[str], qualname: Optional[str]) -> Optional[Any]:
     """Resolve any module attribute from its module + qualified name.
 
@@ -107,6 +116,103 @@ def _resolve_class(module_name: Optional[str], qualname: Optional[str]) -> Optio
     return obj if isinstance(obj, type) else None
 
 
+# class -> generated reifier body; the source depends only on the class's
+# declared fields, so it is compiled once however many builders register the
+# class. The body takes the class as its first argument instead of holding it,
+# so a cached entry never keeps its own key alive.
+_CLASS_REIFIERS: "weakref.WeakKeyDictionary[type, Callable[..., Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _class_fields(cls: type) -> List[Tuple[str, Any, Any]]:
+    """Return ``(name, default, default_factory)`` for each field of ``cls``.
+
+    Dataclasses report their declared fields; other classes are read from the
+    named parameters of ``__init__``. ``MISSING`` marks an absent default.
+    ``__init__`` defaults are not reported: a parameter need not name the
+    attribute it ends up in, so only a dataclass default is safe to restore.
+    """
+    if dataclasses.is_dataclass(cls):
+        return [(f.name, f.default, f.default_factory) for f in dataclasses.fields(cls)]
+    try:
+        params = inspect.signature(cls.__init__).parameters
+    except (TypeError, ValueError):
+        return []
+    found = []
+    for i, p in enumerate(params.values()):
+        if i == 0 or p.kind in (
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        ):
+            continue
+        found.append((p.name, dataclasses.MISSING, dataclasses.MISSING))
+    return found
+
+
+def _compile_class_reifier(cls: type) -> Callable[..., Any]:
+    """Generate a reifier specialized to ``cls``'s fields.
+
+    The generated function allocates with ``object.__new__`` and registers the
+    instance before recursing (so cycles close, as in
+    :meth:`CnDDataInstanceBuilder._reify_generic_object`), then fills each
+    declared field with one ``relations.get`` — falling back to the field's
+    default when the relation is absent — instead of looping over the relation
+    dict per atom. Relations naming anything else are still set afterwards.
+    """
+    body = _CLASS_REIFIERS.get(cls)
+    if body is None:
+        body = _CLASS_REIFIERS[cls] = _compile_reifier_body(cls)
+    return functools.partial(body, cls)
+
+
+def _compile_reifier_body(cls: type) -> Callable[..., Any]:
+    """Compile the class-independent body behind :func:`_compile_class_reifier`."""
+    namespace: Dict[str, Any] = {
+        "_new": object.__new__,
+        "_setattr": object.__setattr__,
+    }
+    lines = [
+        "def reify_instance(_cls, atom, relations, reify_atom, register=None):",
+        "    obj = _new(_cls)",
+        "    if register is not None:",
+        "        register(obj)",
+        "    hits = 0",
+    ]
+    known = []
+    for i, (name, default, factory) in enumerate(_class_fields(cls)):
+        if not name.isidentifier():
+            continue
+        known.append(name)
+        lines += [
+            f"    tids = relations.get({name!r})",
+            # Present but empty still records the field: an empty list, as
+            # the generic per-relation loop has always produced.
+            "    if tids is not None:",
+            "        hits += 1",
+            f"        _setattr(obj, {name!r}, reify_atom(tids[0]) if len(tids) == 1"
+            " else [reify_atom(t) for t in tids])",
+        ]
+        if default is not dataclasses.MISSING:
+            namespace[f"_default{i}"] = default
+            lines += ["    else:", f"        _setattr(obj, {name!r}, _default{i})"]
+        elif factory is not dataclasses.MISSING:
+            namespace[f"_factory{i}"] = factory
+            lines += ["    else:", f"        _setattr(obj, {name!r}, _factory{i}())"]
+    namespace["_known"] = frozenset(known)
+    lines += [
+        "    if hits != len(relations):",
+        "        for name, tids in relations.items():",
+        "            if name not in _known:",
+        "                _setattr(obj, name, reify_atom(tids[0]) if len(tids) == 1"
+        " else [reify_atom(t) for t in tids])",
+        "    return obj",
+    ]
+    code = compile("\n".join(lines), f"<spytial-reifier {cls.__qualname__}>", "exec")
+    exec(code, namespace)
+    return namespace["reify_instance"]
+
+
 def relationalizer(cls: Type = None, *, priority: int = 0):
     """
     Decorator to register a class as a relationalizer.
@@ -135,6 +241,21 @@ class RelationalizerRegistry:
 
     _relationalizers: List[Tuple[int, Type[RelationalizerBase]]] = []
     _instances: List[RelationalizerBase] = []
+    # type -> relationalizer, filled only when every relationalizer consulted
+    # for that type declares ``handles_by_type``. Valid for the _instances
+    # list it was built against; callers that swap that list wholesale (as the
+    # tests do to restore state) get a fresh cache.
+    _by_type: "weakref.WeakKeyDictionary[type, RelationalizerBase]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _by_type_source: Optional[List[RelationalizerBase]] = None
+    # type -> (value-dependent relationalizers to ask in priority order, the
+    # type-level relationalizer to fall back on) for types that some
+    # relationalizer without ``handles_by_type`` may claim. Only those are
+    # asked per object; every type-level ``can_handle`` was settled once.
+    _dispatch_plans: "weakref.WeakKeyDictionary[type, tuple]" = (
+        weakref.WeakKeyDictionary()
+    )
 
     @classmethod
     def register(cls, relationalizer_cls: Type[RelationalizerBase], priority: int = 0):
@@ -146,16 +267,64 @@ class RelationalizerRegistry:
         cls._instances = [
             relationalizer_cls() for _, relationalizer_cls in cls._relationalizers
         ]
+        cls._by_type.clear()
+        cls._dispatch_plans.clear()
 
     @classmethod
     def find_relationalizer(cls, obj: Any) -> Optional[RelationalizerBase]:
         """Find the first relationalizer that can handle the given object."""
-        # First check for object-specific relationalizers
-        # Check registered class-level relationalizers
-        for relationalizer in cls._instances:
+        if cls._by_type_source is not cls._instances:
+            cls._by_type.clear()
+            cls._dispatch_plans.clear()
+            cls._by_type_source = cls._instances
+        typ = type(obj)
+        try:
+            return cls._by_type[typ]
+        except (KeyError, TypeError):
+            pass
+        try:
+            plan = cls._dispatch_plans.get(typ)
+        except TypeError:
+            plan = None  # type not weak-referenceable; plan it every time
+        if plan is None:
+            plan = cls._plan_dispatch(obj)
+            candidates, fallback = plan
+            if not candidates:
+                # No relationalizer we asked looks past the type, so the
+                # answer holds for every instance of typ.
+                if fallback is not None:
+                    try:
+                        cls._by_type[typ] = fallback
+                    except TypeError:
+                        pass
+                return fallback
+            try:
+                cls._dispatch_plans[typ] = plan
+            except TypeError:
+                pass
+        candidates, fallback = plan
+        for relationalizer in candidates:
             if relationalizer.can_handle(obj):
                 return relationalizer
-        return None
+        return fallback
+
+    @classmethod
+    def _plan_dispatch(
+        cls, obj: Any
+    ) -> Tuple[Tuple[RelationalizerBase, ...], Optional[RelationalizerBase]]:
+        """Split the priority scan for ``type(obj)`` into what can be settled now.
+
+        Type-level relationalizers answer the same for every instance, so the
+        first one accepting ``obj`` ends the scan; value-dependent ones ahead of
+        it are returned to be asked per object.
+        """
+        candidates = []
+        for relationalizer in cls._instances:
+            if not relationalizer.handles_by_type:
+                candidates.append(relationalizer)
+            elif relationalizer.can_handle(obj):
+                return tuple(candidates), relationalizer
+        return tuple(candidates), None
 
     @classmethod
     def list_relationalizers(cls) -> List[Tuple[int, str]]:
@@ -174,6 +343,31 @@ class RelationalizerRegistry:
         """Clear all registered relationalizers (for testing)."""
         cls._relationalizers.clear()
         cls._instances.clear()
+        cls._by_type.clear()
+        cls._dispatch_plans.clear()
+
+
+def _quoted_id(text: str) -> str:
+    # Strings use a quoted representation to distinguish them from other IDs.
+    return f'"{text}"'
+
+
+# Exact types whose atom ID _get_id derives from the value rather than the
+# object's identity, with the function producing that ID. Subclasses are left
+# to the general path.
+_VALUE_ID_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    int: str,
+    float: str,
+    bool: str,
+    str: _quoted_id,
+    complex: str,
+    # bytes repr starts with b' so it cannot collide with quoted str IDs
+    bytes: repr,
+    type(None): str,
+    type(NotImplemented): str,
+    type(Ellipsis): str,
+}
+_VALUE_ID_TYPES = frozenset(_VALUE_ID_FORMATTERS)
 
 
 class CnDDataInstanceBuilder:
@@ -185,8 +379,25 @@ class CnDDataInstanceBuilder:
         identity_resolver: Optional[Callable[[Any], Optional[str]]] = None,
     ):
         self._seen = {}
-        self._atoms = []
-        self._rels = {}
+        # Objects given a memory-based ID during the current walk; see _get_id.
+        self._keep_alive: List[Any] = []
+        # (type, atom_id) of value-identified primitives already walked
+        self._primitives_walked: set = set()
+        # atom_id -> emitted atom (dict form), first one recorded wins.
+        self._atoms: Dict[str, Dict] = {}
+        # atom_id -> type of the first atom emitted under that id; a column of
+        # self._atoms kept apart so relation typing is a single lookup.
+        self._atom_types: Dict[str, str] = {}
+        # relation name -> emitted relation (IRelation shape), built up as
+        # edges are recorded; tuple "types" are filled in at the end.
+        self._rels: Dict[str, Dict] = {}
+        # relation name -> atom-id tuples already emitted under it. The walker
+        # may reach the same (source, target) pair via multiple traversal
+        # paths (e.g. forward pointers and back-pointers through a shared
+        # sentinel whose parent was mutated).
+        self._rel_keys: Dict[str, set] = {}
+        # type -> names along its MRO, computed once per type per build.
+        self._type_hierarchies: Dict[type, List[str]] = {}
         self._id_counter = 0
         self._preserve_object_ids = preserve_object_ids
         self._identity_resolver = identity_resolver
@@ -200,9 +411,12 @@ class CnDDataInstanceBuilder:
         self._persistent_atom_labels: Dict[str, str] = {}
         self._collected_decorators = {"constraints": [], "directives": []}
         self._current_depth = 0  # Track current recursion depth
-        # Refreshed per build_instance so a caller who raises the interpreter's
-        # recursion limit gets a deeper walk without rebuilding the builder.
         self._max_depth = default_max_depth()
+        # Walk state: objects discovered past the depth limit but not yet
+        # relationalized, and the children deferred while relationalizing the
+        # current object. Both are None outside a walk.
+        self._worklist: Optional[List[Tuple[Any, RelationalizerBase]]] = None
+        self._pending: Optional[List[Tuple[Any, RelationalizerBase]]] = None
         # Extensibility mechanism: custom reifiers for specific types
         self._custom_reifiers = {}
         self._type_label_counters = {}  # Per-type counters for fallback labels
@@ -221,13 +435,17 @@ class CnDDataInstanceBuilder:
                      from this type will be applied in addition to introspected ones.
         """
         self._seen.clear()
+        self._primitives_walked.clear()
         self._atoms.clear()
+        self._atom_types.clear()
         self._rels.clear()
+        self._rel_keys.clear()
+        self._type_hierarchies = {}
         self._id_counter = 0
-        self._build_identity_objects = {}
-        self._collected_decorators = {"constraints": [], "directives": []}
         self._current_depth = 0  # Reset depth
         self._max_depth = default_max_depth()
+        self._build_identity_objects = {}
+        self._collected_decorators = {"constraints": [], "directives": []}
         # Persist placeholder counters across builds when atom IDs are also
         # being persisted — otherwise every frame's "first new atom of type X"
         # gets index 0, collapsing distinct atoms onto the same TypeN label.
@@ -238,8 +456,6 @@ class CnDDataInstanceBuilder:
         # Extract annotations from as_type if provided
         if as_type is not None:
             try:
-                from .annotations import extract_spytial_annotations
-
                 type_annotations = extract_spytial_annotations(as_type)
                 if type_annotations:
                     self._collected_decorators["constraints"].extend(
@@ -289,54 +505,21 @@ class CnDDataInstanceBuilder:
         # root when every source also appears as a target).
         self._last_root_id = root_atom_id
 
-        # Convert relations to include types (matching IRelation interface)
-        relations = []
-        for rel_name, tuples in self._rels.items():
-            # Deduplicate tuples — the walker may reach the same
-            # (source, target) pair via multiple traversal paths
-            # (e.g. forward pointers and back-pointers through a
-            # shared sentinel whose parent was mutated).
-            seen_tuple_keys: set = set()
-            typed_tuples = []
-            for atom_tuple in tuples:
-                tuple_key = tuple(atom_tuple)
-                if tuple_key in seen_tuple_keys:
-                    continue
-                seen_tuple_keys.add(tuple_key)
-                # Handle all relations the same way (n-ary approach)
-                atom_ids = atom_tuple
-                atom_types = [self._get_atom_type(atom_id) for atom_id in atom_ids]
-                typed_tuples.append(
-                    {
-                        "atoms": atom_ids,
-                        "types": atom_types,
-                    }
-                )
-
-            # Set the types to the types of the first relation in the tuple
-            # Assume arity is constant across all tuples in a relation
-            if typed_tuples:
-                relation_types = ["object"] * len(typed_tuples[0]["types"])
-            else:
-                relation_types = ["object", "object"]  # Default binary
-
-            relations.append(
-                {
-                    "id": rel_name,
-                    "name": rel_name,
-                    "types": relation_types,
-                    "tuples": typed_tuples,
-                }
-            )
-
-        # Deduplicate atoms by ID FIRST - if multiple atoms have the same ID, keep only the first
-        # This is important for primitives where the same value may be referenced multiple times
-        atoms_by_id = {}
-        for atom in self._atoms:
-            if atom["id"] not in atoms_by_id:
-                atoms_by_id[atom["id"]] = atom
+        # Relations were emitted in their final shape during the walk; only the
+        # per-tuple atom types remain, since a target's atom may be recorded
+        # after the edge that points at it.
+        atom_types_by_id = self._atom_types
+        relations = list(self._rels.values())
+        for relation in relations:
+            for typed_tuple in relation["tuples"]:
+                typed_tuple["types"] = [
+                    atom_types_by_id.get(atom_id, "object")
+                    for atom_id in typed_tuple["atoms"]
+                ]
 
-        deduplicated_atoms = list(atoms_by_id.values())
+        # Atoms were deduplicated by ID as they were recorded, keeping the
+        # first; primitives in particular are referenced many times.
+        deduplicated_atoms = list(self._atoms.values())
 
         # Build types from deduplicated atoms to avoid duplicate entries in type.atoms
         typs = self.build_types(deduplicated_atoms)
@@ -390,8 +573,6 @@ class CnDDataInstanceBuilder:
         object instance of that class.  This deduplicates them so the final
         YAML spec contains each unique rule only once.
         """
-        from .annotations import _deduplicate_entries
-
         return {
             "constraints": _deduplicate_entries(
                 self._collected_decorators["constraints"]
@@ -407,6 +588,10 @@ class CnDDataInstanceBuilder:
         For primitives, uses value-based lookup to avoid race conditions with memory addresses.
         For objects, uses memory-based ID with spytial registry fallback.
         """
+        formatter = _VALUE_ID_FORMATTERS.get(type(obj))
+        if formatter is not None:
+            return formatter(obj)
+
         # For primitive types, always use value-based ID (no memory address
         # confusion). Enum members (incl. IntEnum/StrEnum) are excluded: they
         # are singletons handled by reference, and a value-based ID would
@@ -433,21 +618,20 @@ class CnDDataInstanceBuilder:
         oid = id(obj)
 
         if oid not in self._seen:
+            # Hold the object until the walk ends: the ID is keyed on id(obj),
+            # and an object created mid-walk (a property value, say) could
+            # otherwise be freed and its address reused by a different one.
+            self._keep_alive.append(obj)
             # Check if object has a spytial ID for self-reference
             try:
-                from .annotations import OBJECT_ID_ATTR, _OBJECT_ID_REGISTRY
-
-                # First try to get ID from object directly
-                if hasattr(obj, OBJECT_ID_ATTR):
-                    spytial_id = getattr(obj, OBJECT_ID_ATTR)
+                # First try to get ID from object directly (one lookup), then
+                # the identity-keyed global registry
+                spytial_id = getattr(obj, OBJECT_ID_ATTR, None)
+                if spytial_id is None:
+                    spytial_id = _OBJECT_ID_REGISTRY.get(obj)
+                if spytial_id is not None:
                     self._seen[oid] = spytial_id
                     return spytial_id
-                # Then check the identity-keyed global registry
-                else:
-                    spytial_id = _OBJECT_ID_REGISTRY.get(obj)
-                    if spytial_id is not None:
-                        self._seen[oid] = spytial_id
-                        return spytial_id
             except ImportError:
                 pass
 
@@ -493,65 +677,193 @@ class CnDDataInstanceBuilder:
     def _walk(self, obj: Any, max_depth: Optional[int] = None) -> str:
         """Walk an object using the appropriate provider.
 
-        ``max_depth`` defaults to :func:`default_max_depth`, derived from the
-        interpreter's recursion limit so this guard trips before CPython's.
+        Children are walked depth-first on the caller's stack, so atom IDs are
+        handed out in pre-order, until the walk is ``max_depth`` levels deep
+        (default :func:`default_max_depth`). Past that, a relationalizer that
+        asks for a child's ID gets it immediately and the child itself is
+        relationalized later from an explicit LIFO worklist, so nesting depth
+        is bounded by memory rather than by the interpreter's recursion limit.
+        Only relationalizers that set ``walker_assigns_primary_id`` can be
+        deferred this way; any other is always run on the caller's stack.
         """
-        if max_depth is None:
-            max_depth = self._max_depth
-        self._current_depth += 1
-        if self._current_depth > max_depth:
-            raise RecursionError(
-                f"Object nests deeper than {max_depth} levels, the limit for "
-                f"this interpreter (sys.getrecursionlimit() = "
-                f"{sys.getrecursionlimit()}). Raise the recursion limit to "
-                f"walk deeper."
-            )
-
+        limit = self._max_depth if max_depth is None else max_depth
         oid = id(obj)
         if oid in self._seen:
-            self._current_depth -= 1
             return self._seen[oid]
 
-        # Collect decorators from this object
+        if self._worklist is not None:
+            typ = type(obj)
+            if typ in _VALUE_ID_TYPES:
+                # Equal primitives share one value-based atom ID, so only the
+                # first occurrence needs relationalizing -- unless this one
+                # carries annotations of its own in the identity registry.
+                atom_id = self._get_id(obj)
+                key = (typ, atom_id)
+                if (
+                    key in self._primitives_walked
+                    and obj not in _OBJECT_ANNOTATION_REGISTRY
+                ):
+                    return atom_id
+                self._primitives_walked.add(key)
+            else:
+                atom_id = None
+
+            # Called back from inside a relationalizer: recurse while the
+            # stack allows, defer past the depth limit if we can.
+            relationalizer = self._find_relationalizer(obj)
+            if (
+                self._current_depth < limit
+                or not relationalizer.walker_assigns_primary_id
+            ):
+                return self._relationalize(obj, relationalizer)
+            if atom_id is None:
+                atom_id = self._get_id(obj)
+            self._pending.append((obj, relationalizer))
+            return atom_id
+
+        # The limit holds for this walk only; nested calls read it back.
+        saved_limit, self._max_depth = self._max_depth, limit
+        self._worklist = []
         try:
-            from .annotations import collect_decorators
+            root_id = self._relationalize(obj, self._find_relationalizer(obj))
+            worklist = self._worklist
+            while worklist:
+                self._relationalize(*worklist.pop())
+        finally:
+            self._max_depth = saved_limit
+            self._worklist = None
+            self._pending = None
+            self._keep_alive = []
+        return root_id
+
+    def _walk_all(self, objs: Iterable[Any]) -> List[str]:
+        """Walk each of ``objs`` in order and return their atom IDs.
+
+        Same as ``[self._walk(obj) for obj in objs]``, for relationalizers that
+        walk a container's elements back to back: the builder state is bound
+        once for the whole run, and the registry is asked once per run of
+        same-typed elements when it dispatches that type by type alone.
+        """
+        if self._worklist is None:
+            return [self._walk(obj) for obj in objs]
+
+        seen = self._seen
+        primitives_walked = self._primitives_walked
+        annotated = _OBJECT_ANNOTATION_REGISTRY
+        pending = self._pending
+        get_id = self._get_id
+        find_relationalizer = self._find_relationalizer
+        defer = self._current_depth >= self._max_depth
+        by_type = RelationalizerRegistry._by_type
+        ids = []
+        run_type = run_relationalizer = None
+        for obj in objs:
+            atom_id = seen.get(id(obj))
+            if atom_id is not None:
+                ids.append(atom_id)
+                continue
+            typ = type(obj)
+            formatter = _VALUE_ID_FORMATTERS.get(typ)
+            if formatter is not None:
+                atom_id = formatter(obj)
+                key = (typ, atom_id)
+                if key in primitives_walked and obj not in annotated:
+                    ids.append(atom_id)
+                    continue
+                primitives_walked.add(key)
 
-            obj_decorators = collect_decorators(obj)
-            # Merge decorators into our collected set
-            self._collected_decorators["constraints"].extend(
-                obj_decorators["constraints"]
-            )
-            self._collected_decorators["directives"].extend(
-                obj_decorators["directives"]
-            )
-        except Exception as e:
-            # If decorator collection fails, continue without them
-            # This prevents the entire visualization from failing due to annotation issues
-            pass
+            if typ is run_type:
+                relationalizer = run_relationalizer
+            else:
+                relationalizer = find_relationalizer(obj)
+                try:
+                    cached = by_type.get(typ)
+                except TypeError:
+                    cached = None
+                if cached is relationalizer:
+                    run_type, run_relationalizer = typ, relationalizer
+                else:
+                    run_type = run_relationalizer = None
 
-        # Find appropriate relationalizer
+            if not (defer and relationalizer.walker_assigns_primary_id):
+                ids.append(self._relationalize(obj, relationalizer))
+                continue
+            if atom_id is None:
+                atom_id = get_id(obj)
+            pending.append((obj, relationalizer))
+            ids.append(atom_id)
+        return ids
+
+    @staticmethod
+    def _find_relationalizer(obj: Any) -> RelationalizerBase:
         relationalizer = RelationalizerRegistry.find_relationalizer(obj)
         if relationalizer is None:
             raise ValueError(f"No relationalizer found for object of type {type(obj)}")
+        return relationalizer
 
-        # Get atoms and relations from relationalizer
-        atoms_list, relations_list = relationalizer.relationalize(obj, self)
-
-        # Convert to old format for compatibility with existing code
-        atoms = [atom_obj.to_dict() for atom_obj in atoms_list]
+    def _relationalize(self, obj: Any, relationalizer: RelationalizerBase) -> str:
+        """Record the atoms and relations for one object; return its atom ID.
 
-        # Process relations - use to_tuple() method for consistent format
-        relations = []
-        for rel in relations_list:
-            # Use the to_tuple method: (name, atom1, atom2, ...)
-            relations.append(rel.to_tuple())
+        Children the relationalizer reaches past the depth limit are queued on
+        the worklist rather than visited here.
+        """
+        # Collect decorators from this object
+        try:
+            obj_decorators = collect_decorators(obj)
+            # Merge decorators into our collected set; most objects (every
+            # primitive leaf, for one) carry none.
+            if obj_decorators["constraints"]:
+                self._collected_decorators["constraints"].extend(
+                    obj_decorators["constraints"]
+                )
+            if obj_decorators["directives"]:
+                self._collected_decorators["directives"].extend(
+                    obj_decorators["directives"]
+                )
+        except Exception as e:
+            # If decorator collection fails, continue without them
+            # This prevents the entire visualization from failing due to annotation issues
+            pass
 
-        # Add full type hierarchy to each atom
-        type_hierarchy = [cls.__name__ for cls in inspect.getmro(type(obj))]
+        # Get atoms and relations from relationalizer, collecting the
+        # children it defers so they can be queued in reverse order
+        outer_pending = self._pending
+        self._pending = pending = []
+        self._current_depth += 1
+        try:
+            atoms_list, relations_list = relationalizer.relationalize(obj, self)
+        finally:
+            self._current_depth -= 1
+            self._pending = outer_pending
+        self._worklist.extend(reversed(pending))
+
+        # Add full type hierarchy to each atom. Shared by every atom of the
+        # type within this build; build_types hands it out once per type.
+        obj_cls = type(obj)
+        type_hierarchy = self._type_hierarchies.get(obj_cls)
+        if type_hierarchy is None:
+            type_hierarchy = [cls.__name__ for cls in inspect.getmro(obj_cls)]
+            self._type_hierarchies[obj_cls] = type_hierarchy
+
+        # Bound locally: the loops below run once per atom and once per edge.
+        atoms_by_id = self._atoms
+        atom_types = self._atom_types
+        rels = self._rels
+        rel_keys = self._rel_keys
 
         ## TODO: There's a bug here.
         primary_atom_id = None
-        for i, atom in enumerate(atoms):
+        for i, atom_obj in enumerate(atoms_list):
+            atom_id = atom_obj.id
+            if i == 0:
+                primary_atom_id = atom_id
+            if atom_id in atoms_by_id:
+                # The first atom recorded under an ID wins (e.g. a list's index
+                # atoms repeat across lists), so a repeat is never converted.
+                continue
+            # Convert to old format for compatibility with existing code
+            atom = atom_obj.to_dict()
+
             # Only override type and hierarchy for the PRIMARY atom (the one representing this object)
             # Other atoms (like list elements) should keep their own types from the relationalizer
             if i == 0:  # Primary atom - represents the root object being walked
@@ -567,11 +879,9 @@ class CnDDataInstanceBuilder:
                 # containers have dedicated reify paths. Survives build_instance
                 # (only type_hierarchy is stripped); spytial-core ignores the
                 # extra keys for visualization.
-                obj_cls = type(obj)
                 if obj_cls.__module__ != "builtins":
                     atom["__module__"] = obj_cls.__module__
                     atom["__qualname__"] = obj_cls.__qualname__
-                primary_atom_id = atom["id"]
             else:
                 # Secondary atoms (e.g., list elements) - keep their relationalizer-provided type
                 # Don't override with the container's type hierarchy
@@ -579,17 +889,26 @@ class CnDDataInstanceBuilder:
                     atom["type_hierarchy"] = [atom.get("type", "object")]
 
             # Add atom to our collection
-            self._atoms.append(atom)
+            atoms_by_id[atom_id] = atom
+            atom_types[atom_id] = atom["type"]
 
         # Process relations - handle tuples of arbitrary length
-        for rel_data in relations:
-            # Relations now come as (name, atom1, atom2, ...) tuples
-            rel_name = rel_data[0]
-            atom_ids = list(rel_data[1:])  # All atoms after the name
-            self._rels.setdefault(rel_name, []).append(atom_ids)
-
-        # Decrement depth after processing
-        self._current_depth -= 1
+        for rel in relations_list:
+            name = rel.name
+            key = tuple(rel.atoms)
+            seen_keys = rel_keys.get(name)
+            if seen_keys is None:
+                rel_keys[name] = {key}
+                # Assume arity is constant across all tuples in a relation
+                rels[name] = {
+                    "id": name,
+                    "name": name,
+                    "types": ["object"] * len(key),
+                    "tuples": [{"atoms": list(key)}],
+                }
+            elif key not in seen_keys:
+                seen_keys.add(key)
+                rels[name]["tuples"].append({"atoms": list(key)})
 
         # Return the ID of the primary atom
         return primary_atom_id
@@ -600,10 +919,7 @@ class CnDDataInstanceBuilder:
 
     def _get_atom_type(self, atom_id: str) -> str:
         """Get the type of an atom by its ID."""
-        for atom in self._atoms:
-            if atom["id"] == atom_id:
-                return atom["type"]
-        return "object"  # Default fallback
+        return self._atom_types.get(atom_id, "object")  # Default fallback
 
     def build_types(self, atoms: List[Dict]) -> List[Dict]:
         """
@@ -1165,7 +1481,7 @@ class CnDDataInstanceBuilder:
             return False
 
     def register_reifier(
-        self, type_name: str, reifier_func: Callable[..., Any]
+        self, type_name: Any, reifier_func: Optional[Callable[..., Any]] = None
     ) -> None:
         """
         Register a custom reifier function for a specific type.
@@ -1173,12 +1489,17 @@ class CnDDataInstanceBuilder:
         This provides an extensibility mechanism for complex reconstruction scenarios.
 
         Args:
-            type_name: The atom type name to handle (e.g., "MyCustomClass")
+            type_name: The atom type name to handle (e.g., "MyCustomClass"), or
+                       a class, which is shorthand for
+                       ``register_reifier(cls.__name__, cls)``
             reifier_func: Function with signature (atom, relations, reify_atom) -> object
                          where:
                          - atom: Dict containing atom information (id, type, label, etc.)
                          - relations: Dict mapping relation names to lists of target atom IDs
                          - reify_atom: Function to recursively reify other atoms by ID
+                         Passing a class instead generates a reifier that fills
+                         its dataclass fields (or ``__init__`` parameters) from
+                         the matching relations.
 
         Example:
             def custom_reifier(atom, relations, reify_atom):
@@ -1189,7 +1510,14 @@ class CnDDataInstanceBuilder:
                 return obj
 
             builder.register_reifier("MyCustomClass", custom_reifier)
+            builder.register_reifier(Point)  # generated from Point's fields
         """
+        if reifier_func is None:
+            if not isinstance(type_name, type):
+                raise TypeError("register_reifier() needs a reifier or a class")
+            type_name, reifier_func = type_name.__name__, type_name
+        if isinstance(reifier_func, type):
+            reifier_func = _compile_class_reifier(reifier_func)
         self._custom_reifiers[type_name] = reifier_func
 
     def unregister_reifier(self, type_name: str):
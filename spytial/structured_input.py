@@ -15,34 +15,19 @@ Two ways to edit a structured value and get it back as a Python object:
   :func:`edit` uses where the local server isn't reachable.
 """
 
-import json
 import sys
-import tempfile
 import webbrowser
-import yaml
-from dataclasses import MISSING, fields, is_dataclass
+from dataclasses import fields, is_dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Type, get_type_hints
 
-from .provider_system import CnDDataInstanceBuilder
-from .annotations import collect_decorators
+from .provider_system import CnDDataInstanceBuilder, _compile_class_reifier
+from .annotations import collect_decorators, serialize_to_json_string
 from ._edit_server import _EditServer
-from .core_assets import get_template_asset_context
-from .utils import default_method
-
-try:
-    from IPython.display import display, HTML
-
-    HAS_IPYTHON = True
-except ImportError:
-    HAS_IPYTHON = False
-
-try:
-    from jinja2 import Environment, FileSystemLoader
-
-    HAS_JINJA2 = True
-except ImportError:
-    HAS_JINJA2 = False
+from .core_assets import get_template, get_template_asset_context
+from .utils import HAS_JINJA2, default_method, dumps_embedded_json
+from .visualizer import _deliver_html_content as _deliver_visualizer_html
+from .visualizer import _safe_json_for_script
 
 
 # ---------------------------------------------------------------------------
@@ -102,30 +87,7 @@ def _make_dataclass_reifier(dc_type: Type):
     behaviour). Post-init validation can't safely run against a half-built
     cyclic instance; callers that need it can re-run it themselves.
     """
-
-    field_defs = fields(dc_type)
-
-    def _apply_defaults(obj: Any) -> None:
-        for f in field_defs:
-            if f.default is not MISSING:
-                object.__setattr__(obj, f.name, f.default)
-            elif f.default_factory is not MISSING:  # type: ignore[misc]
-                object.__setattr__(obj, f.name, f.default_factory())
-
-    def reifier(atom: Dict, relations: Dict, reify_atom, register=None):
-        obj = object.__new__(dc_type)
-        if register is not None:
-            register(obj)
-        _apply_defaults(obj)
-        for field_name, target_ids in relations.items():
-            if len(target_ids) == 1:
-                value = reify_atom(target_ids[0])
-            else:
-                value = [reify_atom(tid) for tid in target_ids]
-            object.__setattr__(obj, field_name, value)
-        return obj
-
-    return reifier
+    return _compile_class_reifier(dc_type)
 
 
 # ---------------------------------------------------------------------------
@@ -134,18 +96,20 @@ def _make_dataclass_reifier(dc_type: Type):
 
 
 def _generate_cnd_spec(instance: Any) -> str:
-    """Generate a Spytial-Core spec (YAML) from any value's annotations.
+    """Generate a Spytial-Core spec from any value's annotations.
 
-    Works for any object — dataclasses, builtins, or plain instances.
-    ``collect_decorators`` walks the class MRO and instance annotations, so a
-    value with no spytial annotations simply yields an empty spec.
+    The spec is JSON, which core reads as YAML. Works for any object —
+    dataclasses, builtins, or plain instances. ``collect_decorators`` walks the
+    class MRO and instance annotations, so a value with no spytial annotations
+    simply yields an empty spec.
     """
     annotations = collect_decorators(instance)
     spec = {
         "constraints": annotations.get("constraints", []),
         "directives": annotations.get("directives", []),
     }
-    return yaml.dump(spec, default_flow_style=False)
+    # The same serializer diagram() embeds, so both pages read one spec form.
+    return serialize_to_json_string(spec)
 
 
 # ---------------------------------------------------------------------------
@@ -171,16 +135,15 @@ def _generate_editor_html(
         )
 
     current_dir = Path(__file__).parent
-    env = Environment(loader=FileSystemLoader(current_dir))
 
     try:
-        template = env.get_template("input_template.html")
+        template = get_template("input_template.html")
     except Exception as e:
         raise FileNotFoundError(f"input_template.html not found in {current_dir}: {e}")
 
     return template.render(
-        python_data=json.dumps(initial_data),
-        cnd_spec=cnd_spec,
+        python_data=dumps_embedded_json(initial_data),
+        cnd_spec_json=_safe_json_for_script(cnd_spec),  # spec as a JS string
         dataclass_name=dataclass_name,
         # "<type> — sPyTial editor"; "Builder" was a leftover from the old
         # DataClassBuilder. (dataclass_name is the root type name, reused by the
@@ -204,46 +167,19 @@ def _deliver_html_content(
 ) -> Optional[str]:
     """Display or persist already-rendered editor HTML.
 
-    Adapted from :func:`visualizer._deliver_html_content`, but intentionally
+    Delegates to :func:`visualizer._deliver_html_content`, but intentionally
     narrower: only ``"inline"`` and ``"browser"`` (no ``"file"`` / output path),
     since the editor is interactive rather than a saved artifact.
     """
-    if method == "inline":
-        if HAS_IPYTHON:
-            try:
-                import base64
-
-                encoded_html = base64.b64encode(
-                    html_content.encode("utf-8")
-                ).decode("utf-8")
-                iframe_html = (
-                    '<div style="border: 2px solid #007acc; border-radius: 8px; '
-                    'overflow: hidden;">'
-                    f'<iframe src="data:text/html;base64,{encoded_html}" '
-                    f'width="100%" height="{height + 50}px" frameborder="0" '
-                    'style="display: block;"></iframe></div>'
-                )
-                display(HTML(iframe_html))
-                return None
-            except Exception:
-                pass
-
-        return _deliver_html_content(
-            html_content, method="browser", auto_open=auto_open, height=height
-        )
-
-    if method == "browser":
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".html", delete=False, encoding="utf-8"
-        ) as f:
-            f.write(html_content)
-            temp_path = f.name
-
-        if auto_open:
-            webbrowser.open(f"file://{temp_path}")
-        return temp_path
-
-    raise ValueError(f"Unknown display method: {method}")
+    if method not in ("inline", "browser"):
+        raise ValueError(f"Unknown display method: {method}")
+    return _deliver_visualizer_html(
+        html_content,
+        method=method,
+        auto_open=auto_open,
+        height=height,
+        output_filename=None,
+    )
 
 
 # ---------------------------------------------------------------------------
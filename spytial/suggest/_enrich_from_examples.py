@@ -47,6 +47,9 @@ _DIRECTIVE_ARITY = {"orientation": 2, "inferredEdge": 2}
 # not to grind. 2 = propose once, repair at most once.
 _MAX_SELECTOR_ROUNDS = 2
 
+# Anything that can't appear in a selector identifier (ASCII-only by design).
+_NON_IDENTIFIER_RE = re.compile(r"[^0-9A-Za-z_]")
+
 _SELECTOR_SCHEMA = {
     "type": "object",
     "properties": {
@@ -397,7 +400,7 @@ def _as_str(value) -> str:
 
 def _sanitize_name(raw) -> str:
     """Coerce a model-supplied edge name into a safe selector identifier."""
-    name = re.sub(r"[^0-9A-Za-z_]", "", _as_str(raw))
+    name = _NON_IDENTIFIER_RE.sub("", _as_str(raw))
     if not name:
         return "edge"
     if name[0].isdigit():
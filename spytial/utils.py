@@ -2,16 +2,17 @@
 Shared utilities for sPyTial.
 """
 
+import importlib.util
+import json
 import os
 import sys
 from typing import Any
 
-try:
-    from IPython.display import display, HTML
-
-    HAS_IPYTHON = True
-except ImportError:
-    HAS_IPYTHON = False
+# IPython, Jinja2 and orjson are only probed for here; the code that uses them
+# imports them at the point of use, so ``import spytial`` loads none of them.
+HAS_IPYTHON = importlib.util.find_spec("IPython") is not None
+HAS_JINJA2 = importlib.util.find_spec("jinja2") is not None
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
 
 
 def in_vscode() -> bool:
@@ -47,20 +48,38 @@ def edit_environment() -> str:
     return "local"
 
 
+# A running IPython shell lasts for the life of the process, so once one is
+# found its answer is worked out once and reused by every later call.
+_IS_NOTEBOOK = None
+
+
 def is_notebook() -> bool:
     """
     Detect if we're running in a Jupyter notebook environment.
     Returns True if in a notebook, False otherwise.
     """
-    if not HAS_IPYTHON:
+    global _IS_NOTEBOOK
+    # A notebook kernel has always imported IPython by the time user code runs.
+    if not HAS_IPYTHON or "IPython" not in sys.modules:
         return False
+    if _IS_NOTEBOOK is not None:
+        return _IS_NOTEBOOK
 
     try:
         from IPython import get_ipython
 
         ipython = get_ipython()
-        if ipython is None:
-            return False
+    except Exception:
+        return False
+    if ipython is None:
+        return False
+    _IS_NOTEBOOK = _shell_is_notebook(ipython)
+    return _IS_NOTEBOOK
+
+
+def _shell_is_notebook(ipython: Any) -> bool:
+    """True when the IPython shell *ipython* is a notebook kernel."""
+    try:
         # Standard Jupyter (ipykernel) exposes an IPKernelApp config section.
         if "IPKernelApp" in ipython.config:
             return True
@@ -73,6 +92,61 @@ def is_notebook() -> bool:
         return False
 
 
+# Only "&" and the delimiting quote need escaping inside a double-quoted
+# attribute value; one translate pass handles a multi-MB document.
+_SRCDOC_ESCAPES = str.maketrans({"&": "&amp;", '"': "&quot;"})
+
+
+def srcdoc_attribute(html_content: str) -> str:
+    """Escape a full HTML document for an iframe's double-quoted ``srcdoc``.
+
+    Used for inline notebook display in place of a base64 ``data:`` URL,
+    which costs a UTF-8 encode, a base64 pass, and a third more payload.
+    """
+    return html_content.translate(_SRCDOC_ESCAPES)
+
+
+# Fixed markup around the escaped page, so inline display is one join rather
+# than an f-string rebuilt around a multi-KB payload on every call.
+_IFRAME_WRAPPER_PRE = (
+    '<div style="border: 2px solid #007acc; border-radius: 8px; overflow: hidden;">'
+    '<iframe srcdoc="'
+)
+_IFRAME_WRAPPER_MID = '" width="100%" height="'
+_IFRAME_WRAPPER_POST = 'px" frameborder="0" style="display: block;"></iframe></div>'
+
+
+def inline_iframe_html(html_content: str, height: int) -> str:
+    """Wrap a full HTML document in the bordered iframe used for inline display."""
+    return "".join(
+        (
+            _IFRAME_WRAPPER_PRE,
+            srcdoc_attribute(html_content),
+            _IFRAME_WRAPPER_MID,
+            str(height),
+            _IFRAME_WRAPPER_POST,
+        )
+    )
+
+
+def dumps_embedded_json(value: Any) -> str:
+    """Serialize a data instance for embedding in a rendered template.
+
+    Uses ``orjson`` when installed (``pip install spytial_diagramming[fast]``)
+    and compact ``json.dumps`` otherwise. Values orjson refuses, such as
+    non-string dict keys or integers wider than 64 bits, take the
+    ``json.dumps`` path too.
+    """
+    if HAS_ORJSON:
+        import orjson
+
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
 def default_method() -> str:
     """
     Return the default display method based on environment.
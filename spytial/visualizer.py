@@ -9,24 +9,16 @@ import tempfile
 import webbrowser
 from pathlib import Path
 import os
-from typing import Any, Callable, Dict, Optional, Sequence, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Union
 
-from .utils import default_method
-from .core_assets import get_template_asset_context
-
-try:
-    from IPython.display import display, HTML
-
-    HAS_IPYTHON = True
-except ImportError:
-    HAS_IPYTHON = False
-
-try:
-    from jinja2 import Environment, FileSystemLoader
-
-    HAS_JINJA2 = True
-except ImportError:
-    HAS_JINJA2 = False
+from .utils import (
+    HAS_IPYTHON,
+    HAS_JINJA2,
+    default_method,
+    dumps_embedded_json,
+    inline_iframe_html,
+)
+from .core_assets import get_template, get_template_asset_context
 
 
 SEQUENCE_POLICY_NAMES = {
@@ -171,35 +163,36 @@ def _merge_decorator_registries(*registries: Dict[str, Any]) -> Dict[str, Any]:
     return merged
 
 
+def _write_html(f, html_content: Union[str, Iterable[str]]) -> None:
+    """Write rendered HTML, or a stream of HTML chunks, to an open text file."""
+    if isinstance(html_content, str):
+        f.write(html_content)
+    else:
+        for chunk in html_content:
+            f.write(chunk)
+
+
 def _deliver_html_content(
-    html_content: str,
+    html_content: Union[str, Iterable[str]],
     method: str,
     auto_open: bool,
     height: int,
     output_filename: str,
 ) -> Optional[str]:
-    """Display or persist already-rendered visualization HTML."""
+    """Display or persist visualization HTML.
+
+    ``html_content`` may be a template stream (see ``stream=`` on the HTML
+    generators) so that the file and browser methods write the page chunk by
+    chunk instead of first joining it into one string.
+    """
     if method == "inline":
+        if not isinstance(html_content, str):
+            html_content = "".join(html_content)
         if HAS_IPYTHON:
             try:
-                import base64
-
-                encoded_html = base64.b64encode(html_content.encode("utf-8")).decode(
-                    "utf-8"
-                )
-
-                iframe_html = f"""
-                <div style="border: 2px solid #007acc; border-radius: 8px; overflow: hidden;">
-                    <iframe 
-                        src="data:text/html;base64,{encoded_html}" 
-                        width="100%" 
-                        height="{height + 50}px" 
-                        frameborder="0"
-                        style="display: block;">
-                    </iframe>
-                </div>
-                """
+                from IPython.display import display, HTML
 
+                iframe_html = inline_iframe_html(html_content, height + 50)
                 display(HTML(iframe_html))
                 return None
             except Exception as e:
@@ -217,7 +210,7 @@ def _deliver_html_content(
         with tempfile.NamedTemporaryFile(
             mode="w", suffix=".html", delete=False, encoding="utf-8"
         ) as f:
-            f.write(html_content)
+            _write_html(f, html_content)
             temp_path = f.name
 
         if auto_open:
@@ -228,7 +221,7 @@ def _deliver_html_content(
     if method == "file":
         output_path = Path(output_filename)
         with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+            _write_html(f, html_content)
 
         print(f"Visualization saved to: {output_path.absolute()}")
         return str(output_path.absolute())
@@ -236,6 +229,20 @@ def _deliver_html_content(
     raise ValueError(f"Unknown display method: {method}")
 
 
+class DiagramPath(str):
+    """Path returned by :func:`diagram` for the browser, file and headless methods.
+
+    Behaves as the plain path string it always was, and also carries the
+    ``data_instance`` the diagram was rendered from, so a caller that wants
+    the instance as well needn't walk the object again with ``build_instance``.
+    """
+
+    def __new__(cls, path: str, data_instance: Optional[Dict[str, Any]] = None):
+        self = super().__new__(cls, path)
+        self.data_instance = data_instance
+        return self
+
+
 def diagram(
     obj: Any,
     method: Optional[str] = None,
@@ -283,7 +290,8 @@ def diagram(
         diagram(g, as_type=Graph)
 
     Returns:
-        str: Path to the generated HTML file (if method="file", "browser", or "headless")
+        str: Path to the generated HTML file (if method="file", "browser", or "headless"),
+             as a :class:`DiagramPath` whose ``data_instance`` is the rendered instance
         dict: Performance metrics (if method="headless" and perf_iterations > 0)
     """
     as_type = _normalize_as_type(as_type)
@@ -303,7 +311,7 @@ def diagram(
         height = height or detected_height
 
     from .provider_system import CnDDataInstanceBuilder
-    from .annotations import serialize_to_yaml_string
+    from .annotations import serialize_to_json_string
 
     # Serialize the object using the provider system (which now also collects decorators)
     if headless and title:
@@ -316,12 +324,12 @@ def diagram(
     # Get all decorators collected during the build process (from all sub-objects)
     decorators = builder.get_collected_decorators()
 
-    # Serialize the collected decorators into a YAML string
-    spytial_spec = serialize_to_yaml_string(decorators)
+    # Serialize the collected decorators into the spec string for core
+    spytial_spec = serialize_to_json_string(decorators)
 
     if headless and title:
         print(f"Generating HTML for: {title}", flush=True)
-    # Generate the HTML content
+    # Generate the HTML content, streamed when it is only going to disk
     html_content = _generate_visualizer_html(
         data_instance,
         spytial_spec,
@@ -330,19 +338,25 @@ def diagram(
         title,
         perf_path,
         perf_iterations,
+        stream=method in ("browser", "file"),
     )
 
     if method == "headless":
         # Run in headless browser for testing/benchmarking
-        return _run_headless(html_content, perf_path, perf_iterations, timeout, title)
-
-    return _deliver_html_content(
-        html_content,
-        method=method,
-        auto_open=auto_open,
-        height=height,
-        output_filename="spytial_visualization.html",
-    )
+        result = _run_headless(
+            html_content, perf_path, perf_iterations, timeout, title
+        )
+    else:
+        result = _deliver_html_content(
+            html_content,
+            method=method,
+            auto_open=auto_open,
+            height=height,
+            output_filename="spytial_visualization.html",
+        )
+    if isinstance(result, str):
+        return DiagramPath(result, data_instance)
+    return result
 
 
 class SequenceRecorder:
@@ -509,9 +523,9 @@ class SequenceRecorder:
         if self._label_strategy == "back_construct":
             _back_construct_labels(self._data_instances)
 
-        from .annotations import serialize_to_yaml_string
+        from .annotations import serialize_to_json_string
 
-        spytial_spec = serialize_to_yaml_string(self._merged_decorators)
+        spytial_spec = serialize_to_json_string(self._merged_decorators)
         html_content = _generate_sequence_visualizer_html(
             data_instances=self._data_instances,
             frame_labels=self._frame_labels,
@@ -521,6 +535,7 @@ class SequenceRecorder:
             width=_width,
             height=_height,
             title=_title,
+            stream=_method in ("browser", "file"),
         )
 
         return _deliver_html_content(
@@ -707,33 +722,37 @@ def _generate_visualizer_html(
     title=None,
     perf_path=None,
     perf_iterations=None,
+    stream=False,
 ):
-    """Generate HTML content using Jinja2 templating."""
+    """Generate HTML content using Jinja2 templating.
+
+    With ``stream=True`` returns the template's chunk stream rather than the
+    joined page, for callers that write it straight to a file.
+    """
 
     if not HAS_JINJA2:
         raise ImportError(
             "Jinja2 is required for HTML generation. Install with: pip install jinja2"
         )
 
-    # Set up Jinja2 environment
     current_dir = Path(__file__).parent
-    env = Environment(loader=FileSystemLoader(current_dir))
 
     # And error handling in react components COULD go here, depending on What we want to include?
     # Like, mount stuff if needed?
     ## Error viz, Spytial-Core Builder, etc.
 
     try:
-        template = env.get_template("visualizer_template.html")
+        template = get_template("visualizer_template.html")
     except Exception as e:
         raise FileNotFoundError(
             f"visualizer_template.html not found in {current_dir}: {e}"
         )
 
     # Render the template with our data
-    html_content = template.render(
-        python_data=json.dumps(data_instance),  # Properly serialize to JSON
-        cnd_spec=spytial_spec,  # Embed the sPyTial specification
+    render = template.stream if stream else template.render
+    html_content = render(
+        python_data=dumps_embedded_json(data_instance),  # Properly serialize to JSON
+        cnd_spec_json=_safe_json_for_script(spytial_spec),  # sPyTial spec as a JS string
         title=title,  # Page title for browser tab
         width=width,  # Container width
         height=height,  # Container height
@@ -756,18 +775,21 @@ def _generate_sequence_visualizer_html(
     title=None,
     frame_labels=None,
     frame_notes=None,
+    stream=False,
 ):
-    """Generate HTML content for a sequence visualizer using Jinja2 templating."""
+    """Generate HTML content for a sequence visualizer using Jinja2 templating.
+
+    ``stream`` behaves as in :func:`_generate_visualizer_html`.
+    """
     if not HAS_JINJA2:
         raise ImportError(
             "Jinja2 is required for HTML generation. Install with: pip install jinja2"
         )
 
     current_dir = Path(__file__).parent
-    env = Environment(loader=FileSystemLoader(current_dir))
 
     try:
-        template = env.get_template("sequence_visualizer_template.html")
+        template = get_template("sequence_visualizer_template.html")
     except Exception as e:
         raise FileNotFoundError(
             f"sequence_visualizer_template.html not found in {current_dir}: {e}"
@@ -778,11 +800,12 @@ def _generate_sequence_visualizer_html(
     if frame_notes is None:
         frame_notes = [None] * len(data_instances)
 
-    html_content = template.render(
-        sequence_data=json.dumps(data_instances),
+    render = template.stream if stream else template.render
+    html_content = render(
+        sequence_data=dumps_embedded_json(data_instances),
         frame_labels=_safe_json_for_script(frame_labels),
         frame_notes=_safe_json_for_script(frame_notes),
-        cnd_spec=spytial_spec,
+        cnd_spec_json=_safe_json_for_script(spytial_spec),
         sequence_policy=sequence_policy,
         title=title,
         width=width,
@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp_path(tmp_path, monkeypatch):
+    """Run each test from its own temp dir.
+
+    ``diagram(method="file")`` and ``sequence(method="file")`` write their page
+    to a relative filename; without this every such test drops a generated
+    HTML file into the checkout.
+    """
+    monkeypatch.chdir(tmp_path)
@@ -167,3 +167,40 @@ def test_self_reference_id_resolves_via_global_id_registry():
     # without raising (regression guard for the helper migration).
     di = CnDDataInstanceBuilder().build_instance({"s": s})
     assert di["atoms"]
+
+
+def test_one_decorator_rewrites_self_per_object():
+    # The decorator's kwargs are shared across targets; each object must get
+    # its own selector rather than the first target's rewritten one.
+    from spytial.annotations import orientation
+
+    decorate = orientation(selector="self", directions=["below"])
+    a, b = decorate([1]), decorate([2])
+    sel_a = collect_decorators(a)["constraints"][0]["orientation"]["selector"]
+    sel_b = collect_decorators(b)["constraints"][0]["orientation"]["selector"]
+    assert sel_a.startswith("obj_") and sel_b.startswith("obj_")
+    assert sel_a != sel_b
+
+
+def test_concurrent_annotation_loses_nothing():
+    # Several threads annotating the same built-ins must share one registry
+    # and one id per object rather than each creating (and dropping) its own.
+    import threading
+
+    values = [[i] for i in range(50)]
+    ids = [set() for _ in values]
+
+    def work():
+        for value, seen in zip(values, ids):
+            annotate_orientation(value, selector="self", directions=["left"])
+            seen.add(ann._get_or_create_object_id(value))
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for value, seen in zip(values, ids):
+        assert len(ann._OBJECT_ANNOTATION_REGISTRY.get(value)["constraints"]) == 8
+        assert len(seen) == 1
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+import pytest
+
 from spytial.structured_input import _generate_editor_html
 from spytial.evaluator import _generate_evaluator_html
 from spytial.visualizer import (
@@ -58,3 +60,90 @@ def test_editor_html_uses_current_core_bundle_urls():
     assert "window.__spytialCoreBrowserBundle" not in html
     assert "typeof candidate.JSONDataInstance === 'function'" in html
     assert "window.clearAllErrors" in html
+
+
+def test_inline_display_embeds_html_as_srcdoc(monkeypatch):
+    import html as html_module
+    import re
+
+    from spytial import visualizer
+
+    ipython_display = pytest.importorskip("IPython.display")
+    shown = []
+    monkeypatch.setattr(visualizer, "HAS_IPYTHON", True)
+    monkeypatch.setattr(ipython_display, "HTML", lambda markup: markup)
+    monkeypatch.setattr(ipython_display, "display", shown.append)
+
+    page = _generate_visualizer_html({"atoms": [], "relations": []}, "constraints: []\n")
+    visualizer._deliver_html_content(
+        page, method="inline", auto_open=False, height=400, output_filename="unused"
+    )
+
+    (iframe,) = shown
+    assert "base64" not in iframe
+    (srcdoc,) = re.findall(r'srcdoc="([^"]*)"', iframe)
+    assert html_module.unescape(srcdoc) == page
+    assert 'height="450px"' in iframe
+
+
+def test_embedded_json_is_compact_and_round_trips():
+    import json
+
+    from spytial.utils import dumps_embedded_json
+
+    value = {"atoms": [{"id": "n0", "label": "café"}], "relations": [], 1: None}
+    encoded = dumps_embedded_json(value)
+    assert ", " not in encoded and '": ' not in encoded
+    assert json.loads(encoded) == json.loads(json.dumps(value))
+
+
+def test_templates_are_compiled_once():
+    from spytial.core_assets import get_template
+
+    assert get_template("visualizer_template.html") is get_template(
+        "visualizer_template.html"
+    )
+
+
+def test_file_output_streams_the_same_page(tmp_path):
+    from spytial import visualizer
+
+    args = ({"atoms": [], "relations": []}, "constraints: []\n")
+    target = tmp_path / "out.html"
+    visualizer._deliver_html_content(
+        _generate_visualizer_html(*args, stream=True),
+        method="file",
+        auto_open=False,
+        height=400,
+        output_filename=str(target),
+    )
+
+    assert target.read_text(encoding="utf-8") == _generate_visualizer_html(*args)
+
+
+def test_diagram_path_carries_the_rendered_instance(tmp_path):
+    from spytial import visualizer
+    from spytial.provider_system import CnDDataInstanceBuilder
+
+    # conftest's autouse fixture has already moved into tmp_path.
+    value = {"nums": [1, 2]}
+    path = visualizer.diagram(value, method="file", auto_open=False)
+    assert isinstance(path, str) and path == str(tmp_path / "spytial_visualization.html")
+    assert path.data_instance == CnDDataInstanceBuilder().build_instance(value)
+
+
+def test_template_bytecode_cache_write_failure_is_ignored(monkeypatch):
+    jinja2 = pytest.importorskip("jinja2")
+    from spytial.core_assets import _bytecode_cache
+
+    cache = _bytecode_cache()
+    assert cache is not None
+
+    def unwritable(*args, **kwargs):
+        raise PermissionError("read-only temp dir")
+
+    monkeypatch.setattr(jinja2.FileSystemBytecodeCache, "dump_bytecode", unwritable)
+    env = jinja2.Environment(
+        loader=jinja2.DictLoader({"t.html": "{{ x }}"}), bytecode_cache=cache
+    )
+    assert env.get_template("t.html").render(x=1) == "1"
@@ -126,3 +126,62 @@ class TestFullInstance:
         for typ in result["types"]:
             for atom in typ["atoms"]:
                 assert atom["id"] in top_level_ids
+
+
+def test_equal_primitives_are_relationalized_once():
+    from spytial.provider_system import CnDDataInstanceBuilder
+
+    builder = CnDDataInstanceBuilder()
+    walked = []
+    original = builder._relationalize
+
+    def counting(obj, relationalizer):
+        walked.append(obj)
+        return original(obj, relationalizer)
+
+    builder._relationalize = counting
+    value = "".join(["sha", "red"])  # equal to, but not, the interned literal
+    di = builder.build_instance([value, "shared", value, 0.0, -0.0, 0.0])
+
+    assert sum(1 for obj in walked if obj == "shared") == 1
+    assert sum(1 for obj in walked if obj == 0.0) == 2  # 0.0 and -0.0
+    ids = {a["id"] for a in di["atoms"]}
+    assert {'"shared"', "0.0", "-0.0"} <= ids
+
+
+class _Leaf:
+    __slots__ = ("v",)
+
+    def __init__(self):
+        self.v = 1
+
+
+class _Box:
+    @property
+    def leaf(self):
+        return _Leaf()  # a fresh object on every access
+
+
+def test_objects_created_during_the_walk_keep_distinct_ids():
+    # Each leaf exists only while the walk needs it; a freed leaf's address
+    # must not hand its atom ID to the next one.
+    di = _build([_Box() for _ in range(200)])
+    leaf_ids = {a["id"] for a in di["atoms"] if a["type"] == "_Leaf"}
+    assert len(leaf_ids) == 200
+
+
+def test_equal_primitive_keeps_its_own_object_annotations():
+    from spytial import annotate_orientation, collect_decorators
+    from spytial.annotations import _OBJECT_ANNOTATION_REGISTRY
+
+    first = int("1000001")
+    second = int("1000001")  # equal to, but not the same object as, first
+    assert first == second and first is not second
+    annotate_orientation(second, selector="value", directions=["left"])
+    try:
+        builder = CnDDataInstanceBuilder()
+        builder.build_instance([first, second])
+        collected = builder._collected_decorators["constraints"]
+        assert collect_decorators(second)["constraints"][0] in collected
+    finally:
+        _OBJECT_ANNOTATION_REGISTRY.clear()
@@ -55,3 +55,61 @@ def test_class_and_instance_duplicates_are_deduplicated():
     yaml_out = serialize_to_yaml_string(decorators)
     assert yaml_out.count('orientation:') == 1
     assert yaml_out.count('atomStyle:') == 1
+
+
+def test_dont_inherit_applies_to_undecorated_subclass():
+    """A subclass without its own decorators must not pick up its base's
+    registry through attribute inheritance when inheritance is switched off."""
+    from spytial.annotations import dont_inherit_constraints
+
+    @orientation(selector='next', directions=['right'])
+    class Base:
+        pass
+
+    @dont_inherit_constraints
+    class Child(Base):
+        pass
+
+    assert len(collect_decorators(Base())['constraints']) == 1
+    assert collect_decorators(Child())['constraints'] == []
+
+
+def test_base_decorated_after_subclass_collected():
+    """Decorating a base class later still reaches subclasses already seen."""
+
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    assert collect_decorators(Child())['constraints'] == []
+    orientation(selector='next', directions=['right'])(Base)
+    assert len(collect_decorators(Child())['constraints']) == 1
+    orientation(selector='prev', directions=['left'])(Base)
+    assert len(collect_decorators(Child())['constraints']) == 2
+
+
+def test_inheritance_flag_set_after_collection_takes_effect():
+    from spytial.annotations import dont_inherit_constraints
+
+    @orientation(selector='next', directions=['right'])
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    assert len(collect_decorators(Child())['constraints']) == 1
+    dont_inherit_constraints(Child)
+    assert collect_decorators(Child())['constraints'] == []
+
+
+def test_collected_lists_are_independent_of_the_class_cache():
+    @orientation(selector='next', directions=['right'])
+    class Node:
+        pass
+
+    first = collect_decorators(Node())
+    first['constraints'].clear()
+    assert len(collect_decorators(Node())['constraints']) == 1
@@ -36,6 +36,45 @@ def test_decorator_reports_its_own_name(name):
     assert getattr(spytial, name).__name__ == name
 
 
+@pytest.mark.parametrize("name", ALL_DECORATORS)
+def test_object_annotator_exists_and_reports_its_own_name(name):
+    """Each schema type gets an `annotate_<type>` exported from the package."""
+    from spytial.annotations import CONSTRAINT_TYPES, DIRECTIVE_TYPES
+
+    assert name in CONSTRAINT_TYPES or name in DIRECTIVE_TYPES
+    fn = getattr(spytial, f"annotate_{name}")
+    assert fn.__name__ == f"annotate_{name}"
+    assert f"annotate_{name}" in spytial.__all__
+
+
+def test_every_schema_type_has_a_decorator_and_annotator():
+    from spytial.annotations import CONSTRAINT_TYPES, DIRECTIVE_TYPES
+
+    assert set(ALL_DECORATORS) == set(CONSTRAINT_TYPES) | set(DIRECTIVE_TYPES)
+
+
+def test_all_registration_paths_store_flag_as_scalar_and_reject_unknown_types():
+    class Flagged:
+        pass
+
+    spytial.flag(name="hideDisconnected")(Flagged)
+    obj = spytial.annotate_flag([1], name="hideDisconnected")
+    spytial.annotate_type_alias(Flagged, "flag", name="hideDisconnected")
+    try:
+        for registry in (
+            spytial.collect_decorators(Flagged()),
+            spytial.collect_decorators(obj),
+            spytial.get_type_alias_annotations(Flagged),
+        ):
+            assert registry["directives"] == [{"flag": "hideDisconnected"}]
+        with pytest.raises(ValueError, match="Unknown annotation type 'bogus'"):
+            spytial.annotate([1], "bogus", name="x")
+        with pytest.raises(ValueError, match="Unknown annotation type 'bogus'"):
+            spytial.annotate_type_alias(Flagged, "bogus", name="x")
+    finally:
+        spytial.clear_type_alias_annotations(Flagged)
+
+
 @pytest.mark.parametrize("name", ["atomColor", "edgeColor", "projection"])
 def test_deprecated_decorators_say_so(name):
     doc = getattr(spytial, name).__doc__
@@ -370,3 +409,18 @@ def test_draw_group_name_is_left_to_core():
     assert Target.__spytial_registry__["directives"][0]["inferredEdge"]["draw"] == (
         "declared_elsewhere -> _"
     )
+
+
+def test_schema_tables_are_frozen_but_shorthand_still_validates(capsys):
+    """The built-in schemas are read-only; callers passing the list/dict
+    shorthand to validate_fields get the same checks and messages."""
+    from spytial.annotations import CONSTRAINT_TYPES, DIRECTIVE_TYPES, validate_fields
+
+    with pytest.raises(TypeError):
+        DIRECTIVE_TYPES["size"] = ["selector"]
+    with pytest.raises(ValueError, match="No valid field set found for 'group'"):
+        validate_fields("group", {"selector": "x"}, CONSTRAINT_TYPES["group"])
+    with pytest.raises(ValueError, match="Missing required fields for 'size': width"):
+        validate_fields("size", {"selector": "x", "height": 1}, ["selector", "height", "width"])
+    validate_fields("hideField", {"field": "f", "bogus": 1}, {"required": ["field"]})
+    assert "Unknown fields for 'hideField': bogus" in capsys.readouterr().out
@@ -347,3 +347,20 @@ def test_edit_unsupported_env_falls_back_to_edit_html(monkeypatch, env):
     monkeypatch.setattr(si, "edit_html", lambda inst, **k: calls.setdefault("inst", inst))
     assert si.edit({"a": 1}) is None
     assert calls["inst"] == {"a": 1}
+
+
+def test_is_notebook_asks_the_shell_once(monkeypatch):
+    ipython_module = pytest.importorskip("IPython")
+
+    class _Kernel:
+        config = {"IPKernelApp": {}}
+
+    calls = []
+    monkeypatch.setattr(su, "_IS_NOTEBOOK", None)
+    monkeypatch.setattr(ipython_module, "get_ipython", lambda: calls.append(1))
+    assert su.is_notebook() is False and su._IS_NOTEBOOK is None  # no shell yet
+
+    monkeypatch.setattr(ipython_module, "get_ipython", lambda: calls.append(1) or _Kernel())
+    assert su.is_notebook() is True
+    assert su.is_notebook() is True
+    assert len(calls) == 2
@@ -232,6 +232,18 @@ def test_self_reference_in_selectors():
     
     print("✓ Self-reference in selectors works correctly")
 
+
+def test_self_reference_rewrites_whole_words_only():
+    from spytial.annotations import _process_selector_for_self_reference
+
+    rewrite = _process_selector_for_self_reference
+    assert rewrite("self.left + itself", "obj_1") == "obj_1.left + itself"
+    assert rewrite("selfish.next", "obj_1") == "selfish.next"
+    assert rewrite("Node", "obj_1") == "Node"
+    assert rewrite(None, "obj_1") is None
+    # The ID is inserted literally, never read as a replacement template.
+    assert rewrite("self", r"obj_\1") == r"obj_\1"
+
 if __name__ == "__main__":
     print("Testing Object-Level Spytial-Core Annotations\n")
     
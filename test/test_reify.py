@@ -378,6 +378,71 @@ def test_dataclass_reifier_backcompat_3arg_signature():
     assert out == Simple(x=42)
 
 
+def test_register_reifier_with_class_fills_fields_and_defaults():
+    @dataclass
+    class Tagged:
+        name: str
+        tags: List[str] = field(default_factory=list)
+        next: Optional["Tagged"] = None
+
+    a = Tagged("a", ["t"])
+    a.next = a
+    di = CnDDataInstanceBuilder().build_instance(a)
+    # Drop the tags relation, as an editor might; the default must fill it.
+    di["relations"] = [r for r in di["relations"] if r["name"] != "tags"]
+
+    r = CnDDataInstanceBuilder()
+    r.register_reifier(Tagged)
+    out = r.reify(di)
+    assert type(out) is Tagged
+    assert out.name == "a" and out.tags == []
+    assert out.next is out
+
+
+def test_register_reifier_with_class_reifies_empty_list_fields():
+    from spytial.provider_system import _compile_class_reifier
+
+    @dataclass
+    class Bag:
+        items: List[int]
+        tags: List[str] = field(default_factory=list)
+
+    di = CnDDataInstanceBuilder().build_instance(Bag([], []))
+    r = CnDDataInstanceBuilder()
+    r.register_reifier(Bag)
+    out = r.reify(di)
+    assert type(out) is Bag and out.items == [] and out.tags == []
+    # A relation recorded with no targets still yields an empty list.
+    bare = _compile_class_reifier(Bag)({}, {"items": [], "extra": []}, None)
+    assert bare.items == [] and bare.extra == []
+
+
+def test_compiled_class_reifier_does_not_keep_its_class_alive():
+    import gc
+    import weakref
+
+    from spytial.provider_system import _CLASS_REIFIERS, _compile_class_reifier
+
+    @dataclass
+    class Scratch:
+        value: int = 0
+
+    _compile_class_reifier(Scratch)
+    assert Scratch in _CLASS_REIFIERS
+    ref = weakref.ref(Scratch)
+    del Scratch
+    gc.collect()
+    assert ref() is None
+
+
+def test_register_reifier_with_plain_class_uses_init_parameters():
+    di = CnDDataInstanceBuilder().build_instance(Vec(3, 4))
+    r = CnDDataInstanceBuilder()
+    r.register_reifier("Vec", Vec)
+    out = r.reify(di)
+    assert type(out) is Vec and (out.x, out.y) == (3, 4)
+
+
 # ---------------------------------------------------------------------------
 # Rebuilding the REAL object (object.__new__ via module/qualname) + replit
 # ---------------------------------------------------------------------------
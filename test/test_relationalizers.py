@@ -169,6 +169,111 @@ def test_frozenset_relationalizer_walks_elements():
 
 
 
+def test_dispatch_is_cached_per_type_for_builtin_relationalizers():
+    from spytial.domain_relationalizers import ListRelationalizer
+
+    found = RelationalizerRegistry.find_relationalizer([1, 2])
+    assert isinstance(found, ListRelationalizer)
+    assert RelationalizerRegistry._by_type[list] is found
+
+
+def test_value_dependent_relationalizer_is_not_cached_by_type():
+    original_relationalizers = RelationalizerRegistry._relationalizers.copy()
+    original_instances = RelationalizerRegistry._instances.copy()
+
+    try:
+        @relationalizer(priority=100)
+        class ShortStringRelationalizer(RelationalizerBase):
+            def can_handle(self, obj: Any) -> bool:
+                return isinstance(obj, str) and len(obj) < 3
+
+            def relationalize(self, obj: Any, walker_func) -> Tuple[List[Atom], List[Relation]]:
+                atom = Atom(id=walker_func._get_id(obj), type="short", label=obj)
+                return [atom], []
+
+        assert isinstance(
+            RelationalizerRegistry.find_relationalizer("ab"), ShortStringRelationalizer
+        )
+        assert not isinstance(
+            RelationalizerRegistry.find_relationalizer("abcdef"),
+            ShortStringRelationalizer,
+        )
+        assert str not in RelationalizerRegistry._by_type
+
+    finally:
+        RelationalizerRegistry._relationalizers = original_relationalizers
+        RelationalizerRegistry._instances = original_instances
+
+    assert not isinstance(
+        RelationalizerRegistry.find_relationalizer("ab"), ShortStringRelationalizer
+    )
+
+
+def test_only_value_dependent_relationalizers_are_asked_per_object():
+    from spytial.domain_relationalizers import DictRelationalizer
+
+    original_relationalizers = RelationalizerRegistry._relationalizers.copy()
+    original_instances = RelationalizerRegistry._instances.copy()
+    asked = []
+
+    try:
+        @relationalizer(priority=100)
+        class TaggedDictRelationalizer(RelationalizerBase):
+            def can_handle(self, obj: Any) -> bool:
+                asked.append(obj)
+                return isinstance(obj, dict) and "tag" in obj
+
+            def relationalize(self, obj: Any, walker_func) -> Tuple[List[Atom], List[Relation]]:
+                atom = Atom(id=walker_func._get_id(obj), type="tagged", label=obj["tag"])
+                return [atom], []
+
+        found = RelationalizerRegistry.find_relationalizer({"tag": "t"})
+        assert isinstance(found, TaggedDictRelationalizer)
+        assert isinstance(
+            RelationalizerRegistry.find_relationalizer({"a": 1}), DictRelationalizer
+        )
+        assert dict not in RelationalizerRegistry._by_type
+        candidates, fallback = RelationalizerRegistry._dispatch_plans[dict]
+        assert candidates == (found,) and isinstance(fallback, DictRelationalizer)
+        assert len(asked) == 2
+    finally:
+        RelationalizerRegistry._relationalizers = original_relationalizers
+        RelationalizerRegistry._instances = original_instances
+
+
+def test_generic_object_members_skip_methods_but_keep_shadowing_attributes():
+    class Widget:
+        size = 3
+
+        def __init__(self):
+            self.color = "red"
+            self.render = "shadowed"
+
+        def render(self):
+            return "method"
+
+        @property
+        def area(self):
+            return self.size * self.size
+
+    di = CnDDataInstanceBuilder().build_instance(Widget())
+    names = {r["name"] for r in di["relations"]}
+    assert {"area", "color", "render", "size"} <= names
+
+
+def test_generic_object_members_follow_each_instance_layout():
+    class Record:
+        pass
+
+    a, b = Record(), Record()
+    a.x = 1
+    b.x, b.y = 2, 3
+    builder = CnDDataInstanceBuilder()
+    for obj, expected in ((a, {"x"}), (b, {"x", "y"}), (a, {"x"})):
+        di = builder.build_instance(obj)
+        assert {r["name"] for r in di["relations"]} == expected
+
+
 def test_registry_management():
     """Test relationalizer registry management."""
     
@@ -264,3 +369,40 @@ if __name__ == "__main__":
     print("  class MyRelationalizer(RelationalizerBase):")
     print("      def can_handle(self, obj): ...")
     print("      def relationalize(self, obj, walker_func): ...")
+
+
+def test_relation_names_and_atom_types_are_interned():
+    import sys
+
+    name = "".join(["ne", "xt"])
+    assert Relation(name, ["a", "b"]).name is sys.intern("next")
+    assert Atom(id="a", type="".join(["No", "de"]), label="a").type is sys.intern("Node")
+
+
+def test_atoms_and_relations_are_slotted():
+    atom = Atom(id="a", type="Node", label="a")
+    relation = Relation("next", ["a", "b"])
+    assert not hasattr(atom, "__dict__") and not hasattr(relation, "__dict__")
+    assert atom.meta is None
+    assert atom.to_dict() == {"id": "a", "type": "Node", "label": "a"}
+
+
+def test_builtin_relationalizers_emit_relation_atoms_as_lists():
+    """Relation.atoms is a list whichever relationalizer produced it."""
+    from dataclasses import dataclass
+    from spytial.provider_system import CnDDataInstanceBuilder
+
+    @dataclass
+    class Point:
+        x: int
+
+    class Plain:
+        def __init__(self):
+            self.a = 1
+
+    for value in ({"k": 1}, [1], (1, 2), {1}, range(2), Point(1), Plain()):
+        builder = CnDDataInstanceBuilder()
+        relationalizer = RelationalizerRegistry.find_relationalizer(value)
+        _, relations = relationalizer.relationalize(value, builder)
+        assert relations, value
+        assert all(type(rel.atoms) is list for rel in relations), value
@@ -0,0 +1,96 @@
+"""
+Tests for turning collected decorators into the spec string handed to core.
+"""
+
+import json
+
+import yaml
+
+from spytial.annotations import (
+    serialize_to_json_string,
+    serialize_to_yaml_string,
+)
+from spytial.visualizer import _generate_visualizer_html
+
+
+def test_repeated_serialization_returns_the_same_yaml():
+    decorators = {
+        "constraints": [{"orientation": {"selector": "left", "directions": ["below"]}}],
+        "directives": [{"flag": "hideDisconnectedBuiltIns"}],
+    }
+    first = serialize_to_yaml_string(decorators)
+    second = serialize_to_yaml_string(
+        {
+            "directives": [{"flag": "hideDisconnectedBuiltIns"}],
+            "constraints": [
+                {"orientation": {"directions": ["below"], "selector": "left"}}
+            ],
+        }
+    )
+    assert first == second
+    assert yaml.safe_load(first) == decorators
+
+
+def test_cached_yaml_tracks_value_changes():
+    a = serialize_to_yaml_string({"constraints": [], "directives": [{"size": {"width": 1}}]})
+    b = serialize_to_yaml_string({"constraints": [], "directives": [{"size": {"width": 2}}]})
+    assert a != b
+    assert yaml.safe_load(b)["directives"][0]["size"]["width"] == 2
+
+
+def test_cache_keeps_int_and_str_keys_apart():
+    as_int = serialize_to_yaml_string({"directives": [{"size": {1: "a"}}]})
+    as_str = serialize_to_yaml_string({"directives": [{"size": {"1": "a"}}]})
+    assert yaml.safe_load(as_int)["directives"][0]["size"] == {1: "a"}
+    assert yaml.safe_load(as_str)["directives"][0]["size"] == {"1": "a"}
+
+
+def test_tuples_serialize_as_sequences():
+    out = serialize_to_yaml_string(
+        {"constraints": [{"orientation": {"selector": "s", "directions": ("left", "below")}}]}
+    )
+    assert yaml.safe_load(out)["constraints"][0]["orientation"]["directions"] == [
+        "left",
+        "below",
+    ]
+
+
+def test_json_spec_is_yaml_equivalent():
+    decorators = {
+        "constraints": [{"orientation": {"selector": "left", "directions": ("below",)}}],
+        "directives": [{"atomColor": {"selector": "Node", "value": "#ff0000"}}],
+    }
+    out = serialize_to_json_string(decorators)
+    # core parses the spec as YAML; JSON must read back the same either way.
+    assert yaml.safe_load(out) == json.loads(out)
+    assert json.loads(out) == yaml.safe_load(serialize_to_yaml_string(decorators))
+
+
+def test_non_json_spec_falls_back_to_yaml():
+    decorators = {"constraints": [], "directives": [{"flag": {"a", "b"}}]}
+    assert yaml.safe_load(serialize_to_json_string(decorators)) == decorators
+
+
+def test_non_string_keys_fall_back_to_yaml():
+    decorators = {"constraints": [], "directives": [{"size": {1: "a", "1": "b"}}]}
+    out = serialize_to_json_string(decorators)
+    assert yaml.safe_load(out) == decorators
+
+
+def test_editor_spec_uses_the_diagram_serializer():
+    from spytial.structured_input import _generate_cnd_spec
+
+    assert _generate_cnd_spec({"a": 1}) == serialize_to_json_string(
+        {"constraints": [], "directives": []}
+    )
+
+
+def test_spec_embeds_as_a_script_string_literal():
+    spec = serialize_to_json_string(
+        {"directives": [{"attribute": {"field": "`${x}` </script>"}}]}
+    )
+    html = _generate_visualizer_html({"atoms": [], "relations": []}, spec)
+    line = next(l for l in html.splitlines() if "const cndSpec" in l)
+    literal = line.split("=", 1)[1].strip().rstrip(";")
+    assert "</script>" not in literal
+    assert json.loads(literal) == spec
@@ -92,6 +92,47 @@ class TestAnnotatedTypeAliases:
         annotations = spytial.extract_spytial_annotations(plain_list)
         assert annotations is None
 
+    def test_repeated_extraction_returns_fresh_lists(self):
+        """Test that a reused alias is read once but callers get their own lists."""
+        from spytial.annotations import _ANNOTATED_ENTRIES
+
+        IntList = Annotated[
+            list[int], spytial.Orientation(selector="items", directions=["left"])
+        ]
+        first = spytial.extract_spytial_annotations(IntList)
+        first["constraints"].append({"cyclic": {}})
+        assert IntList in _ANNOTATED_ENTRIES
+        second = spytial.extract_spytial_annotations(IntList)
+        assert len(second["constraints"]) == 1
+        # Unhashable metadata can't be memoized but still extracts.
+        Unhashable = Annotated[list, [], spytial.Size(selector="items", height=1, width=1)]
+        assert len(spytial.extract_spytial_annotations(Unhashable)["directives"]) == 1
+
+    def test_annotations_are_slotted_with_a_prebuilt_entry(self):
+        """Annotation instances carry no __dict__ and serialize to one shared entry."""
+        for ann in (
+            spytial.Orientation(selector="items", directions=["left"]),
+            spytial.EdgeStyle(field="next", lineStyle=spytial.LineStyle(color="red")),
+            spytial.Flag(name="hideDisconnected"),
+        ):
+            assert not hasattr(ann, "__dict__")
+            assert ann.to_entry() is ann.to_entry()
+        assert spytial.Flag(name="hideDisconnected").to_entry() == {"flag": "hideDisconnected"}
+
+    def test_constraint_kind_comes_from_the_schema_tables(self):
+        """Subclasses take _is_constraint from the table naming their type."""
+        from spytial.annotations import CONSTRAINT_TYPES, SpytialAnnotation
+
+        for cls in (spytial.Orientation, spytial.Group, spytial.Tag, spytial.EdgeColor):
+            assert cls._is_constraint is (cls._annotation_type in CONSTRAINT_TYPES)
+        # Bases and subclasses naming no known type are left as declared.
+        base = type("Base", (SpytialAnnotation,), {"__slots__": ()})
+        assert base._is_constraint is True
+        custom = type(
+            "Custom", (base,), {"__slots__": (), "_annotation_type": "mine", "_is_constraint": False}
+        )
+        assert custom._is_constraint is False
+
     def test_annotation_repr(self):
         """Test annotation repr for debugging."""
         ann = spytial.Orientation(selector="items", directions=["left"])
@@ -176,6 +217,20 @@ class TestLegacyTypeAliasRegistry:
         assert annotations is not None
         assert len(annotations["constraints"]) == 1
 
+    def test_legacy_keys_for_classes_and_generic_aliases(self):
+        """A class keys as itself; equal generic aliases share one entry."""
+        from spytial.annotations import _normalize_type_alias_key
+
+        class Node:
+            pass
+
+        assert _normalize_type_alias_key(Node) is Node
+        spytial.annotate_type_alias(Node, "hideAtom", selector="Node")
+        assert spytial.get_type_alias_annotations(Node) is not None
+        spytial.annotate_type_alias(list[int], "hideAtom", selector="items")
+        assert spytial.get_type_alias_annotations(list[int]) is not None
+        assert spytial.get_type_alias_annotations(list[str]) is None
+
     @pytest.mark.filterwarnings("ignore::DeprecationWarning")
     def test_legacy_clear(self):
         """Test legacy clear function."""
@@ -1,3 +1,6 @@
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import spytial
@@ -14,3 +17,56 @@ def test_pyproject_uses_dynamic_version_from_package():
 
     assert 'dynamic = ["version"]' in text
     assert 'version = {attr = "spytial._version.__version__"}' in text
+
+
+def test_import_defers_rendering_modules():
+    code = (
+        "import sys, spytial\n"
+        "lazy = ('spytial.visualizer', 'spytial.structured_input', 'http.server',\n"
+        "        'spytial.provider_system', 'spytial.annotations')\n"
+        "assert not any(m in sys.modules for m in lazy), sorted(sys.modules)\n"
+        "assert callable(spytial.orientation) and 'spytial.provider_system' not in sys.modules\n"
+        "assert callable(spytial.diagram) and callable(spytial.edit)\n"
+        "assert 'spytial.visualizer' in sys.modules\n"
+        "assert 'evaluate' in dir(spytial)\n"
+        "from spytial import *\n"
+        "assert callable(CnDDataInstanceBuilder)\n"
+    )
+    env = {k: v for k, v in os.environ.items() if k != "SPYTIAL_EAGER_IMPORT"}
+    subprocess.run(
+        [sys.executable, "-c", code], check=True, cwd=Path(__file__).resolve().parents[1], env=env
+    )
+
+
+def test_eager_import_mode_resolves_every_name():
+    code = (
+        "import sys, spytial\n"
+        "assert 'spytial.visualizer' in sys.modules\n"
+        "missing = [n for n in spytial.__all__ if n not in vars(spytial) and n != 'suggest']\n"
+        "assert not missing, missing\n"
+        "# No optional-import fallbacks: an exported name is never a None placeholder.\n"
+        "phantom = [n for n in spytial.__all__ if vars(spytial).get(n, ...) is None]\n"
+        "assert not phantom, phantom\n"
+    )
+    env = dict(os.environ, SPYTIAL_EAGER_IMPORT="1")
+    subprocess.run(
+        [sys.executable, "-c", code], check=True, cwd=Path(__file__).resolve().parents[1], env=env
+    )
+
+
+def test_pyproject_lists_every_package():
+    root = Path(__file__).resolve().parents[1]
+    text = (root / "pyproject.toml").read_text(encoding="utf-8")
+    for init in (root / "spytial").rglob("__init__.py"):
+        package = ".".join(init.parent.relative_to(root).parts)
+        assert f'"{package}"' in text, f"{package} missing from [tool.setuptools] packages"
+
+
+def test_annotations_star_import_exports_the_decorator_surface():
+    import spytial.annotations as annotations
+
+    namespace = {}
+    exec("from spytial.annotations import *", namespace)
+    for name in ("orientation", "Orientation", "annotate_group", "apply_if", "LineStyle"):
+        assert name in namespace
+    assert all(hasattr(annotations, name) for name in annotations.__all__)
@@ -1,25 +1,22 @@
-"""Depth guard for the object walk.
+"""Nesting depth for the object walk.
 
-The walker recurses through real Python frames: one level of nesting costs
-3-4 of them. Its own limit is therefore derived from the interpreter's frame
-budget rather than fixed, so it always trips *before* CPython's — the walker
-raises one clean error, CPython unwinds thousands of frames.
-
-Tracked for removal in sidprasad/spytial#131 (iterative walk).
+The walker recurses through Python frames up to ``default_max_depth()`` levels
+and carries on from an explicit worklist past that, so how deep a structure
+nests is bounded by memory, not by the interpreter's recursion limit.
 """
 
 import dataclasses
 import sys
-from typing import Optional
+from typing import Any, List, Optional, Tuple
 
 import pytest
 
 from spytial.provider_system import (
     CnDDataInstanceBuilder,
+    RelationalizerRegistry,
     default_max_depth,
-    _MIN_WALK_DEPTH,
-    _MAX_WALK_DEPTH,
 )
+from spytial.domain_relationalizers.base import RelationalizerBase, Atom, Relation
 
 
 @dataclasses.dataclass
@@ -35,50 +32,120 @@ def chain(n):
     return head
 
 
-@pytest.fixture
-def recursion_limit():
-    """Restore the interpreter's recursion limit after a test changes it."""
-    original = sys.getrecursionlimit()
-    yield sys.setrecursionlimit
-    sys.setrecursionlimit(original)
-
-
-def test_depth_scales_with_interpreter_limit(recursion_limit):
-    recursion_limit(1000)  # stock CPython
-    stock = default_max_depth()
-    recursion_limit(4000)
-    raised = default_max_depth()
-    assert raised > stock
-
-
-def test_depth_stays_within_documented_bounds(recursion_limit):
-    for limit in (100, 1000, 3000, 100_000):
-        recursion_limit(max(limit, 100))
-        assert _MIN_WALK_DEPTH <= default_max_depth() <= _MAX_WALK_DEPTH
-
-
-def test_guard_trips_before_cpython_does(recursion_limit):
-    # The point of deriving the cap: our error, not a 1000-frame unwind.
-    recursion_limit(1000)
-    with pytest.raises(RecursionError) as exc:
-        CnDDataInstanceBuilder().build_instance(chain(default_max_depth() + 50))
-    assert "nests deeper than" in str(exc.value)
-
-
-def test_error_message_does_not_embed_the_object():
-    # A deep structure's repr is a screenful and can itself raise while
-    # formatting, so the message names the type only.
-    deep = chain(default_max_depth() + 50)
-    with pytest.raises(RecursionError) as exc:
-        CnDDataInstanceBuilder().build_instance(deep)
-    message = str(exc.value)
-    assert "Link(value=" not in message
-    assert "Link" in message and len(message) < 400
-
-
-def test_chain_within_limit_walks_fully():
-    # Regression: with `_next` skipped this produced 2 atoms regardless of
-    # length; the depth guard must not silently truncate what it now follows.
-    length = min(120, default_max_depth() - 5)
+def test_chain_deeper_than_recursion_limit_walks_fully():
+    length = sys.getrecursionlimit() * 5
     di = CnDDataInstanceBuilder().build_instance(chain(length))
     assert sum(1 for a in di["atoms"] if a["type"] == "Link") == length
+    assert len(di["relations"]) > 0
+
+
+def test_nested_lists_deeper_than_recursion_limit():
+    depth = sys.getrecursionlimit() * 2
+    nested: list = []
+    for _ in range(depth):
+        nested = [nested]
+    di = CnDDataInstanceBuilder().build_instance(nested)
+    assert sum(1 for a in di["atoms"] if a["type"] == "list") == depth + 1
+
+
+def test_default_max_depth_follows_recursion_limit():
+    saved = sys.getrecursionlimit()
+    try:
+        sys.setrecursionlimit(400)
+        assert default_max_depth() == 100
+        sys.setrecursionlimit(1000)
+        assert default_max_depth() == 125
+        sys.setrecursionlimit(3000)
+        assert default_max_depth() == 375
+    finally:
+        sys.setrecursionlimit(saved)
+
+
+def test_atom_ids_are_assigned_in_depth_first_preorder():
+    # A nested list's elements are numbered before its later siblings.
+    inner, later = Link(1), Link(2)
+    di = CnDDataInstanceBuilder().build_instance([[inner], later, Link(3, inner)])
+    ids = {a["id"]: a["type"] for a in di["atoms"] if a["id"].startswith("n")}
+    assert ids == {"n0": "list", "n1": "list", "n2": "Link", "n3": "Link", "n4": "Link"}
+    (value,) = [r for r in di["relations"] if r["name"] == "value"]
+    assert ["n2", "1"] in [t["atoms"] for t in value["tuples"]]
+    assert ["n3", "2"] in [t["atoms"] for t in value["tuples"]]
+
+
+def test_walk_past_explicit_max_depth_keeps_going():
+    builder = CnDDataInstanceBuilder()
+    # Past the limit the walk defers rather than raising.
+    builder._walk(chain(20), max_depth=3)
+    assert sum(1 for a in builder._atoms.values() if a["type"] == "Link") == 20
+    # The limit applied to that call only.
+    assert builder._max_depth == default_max_depth()
+
+
+def test_cyclic_chain_terminates():
+    head = chain(50)
+    tail = head
+    while tail._next is not None:
+        tail = tail._next
+    tail._next = head
+    di = CnDDataInstanceBuilder().build_instance(head)
+    assert sum(1 for a in di["atoms"] if a["type"] == "Link") == 50
+
+
+def test_shared_child_is_relationalized_once():
+    shared = Link(0)
+    di = CnDDataInstanceBuilder().build_instance([Link(1, shared), shared])
+    link_ids = [a["id"] for a in di["atoms"] if a["type"] == "Link"]
+    assert len(link_ids) == len(set(link_ids)) == 2
+
+
+class Box:
+    def __init__(self, item):
+        self.item = item
+
+
+class EagerBoxRelationalizer(RelationalizerBase):
+    """Third-party style relationalizer that does not opt into deferral."""
+
+    def can_handle(self, obj: Any) -> bool:
+        return isinstance(obj, Box)
+
+    def relationalize(self, obj: Any, walker_func) -> Tuple[List[Atom], List[Relation]]:
+        obj_id = walker_func._get_id(obj)
+        item_id = walker_func(obj.item)
+        return [Atom(id=obj_id, type="Box", label="box")], [
+            Relation("item", [obj_id, item_id])
+        ]
+
+
+@pytest.fixture
+def eager_box_relationalizer():
+    saved = list(RelationalizerRegistry._relationalizers)
+    RelationalizerRegistry.register(EagerBoxRelationalizer, priority=200)
+    yield
+    RelationalizerRegistry.clear()
+    for priority, cls in saved:
+        RelationalizerRegistry.register(cls, priority)
+
+
+def test_relationalizer_without_deferral_still_walks(eager_box_relationalizer):
+    di = CnDDataInstanceBuilder().build_instance([Box(Link(7))])
+    types = {a["type"] for a in di["atoms"]}
+    assert {"list", "Box", "Link"} <= types
+    (item,) = [r for r in di["relations"] if r["name"] == "item"]
+    box_id, link_id = item["tuples"][0]["atoms"]
+    assert link_id in {a["id"] for a in di["atoms"] if a["type"] == "Link"}
+
+
+def test_walking_elements_in_runs_matches_walking_each():
+    shared = Link(3)
+    items = [1, "a", 1, shared, [shared], shared, None, "a"]
+    items.append(items)
+    builder = CnDDataInstanceBuilder()
+    di = builder.build_instance(items)
+    root = builder._last_root_id
+    (idx,) = [r for r in di["relations"] if r["name"] == "idx"]
+    targets = [t["atoms"][2] for t in idx["tuples"] if t["atoms"][0] == root]
+    assert targets[:3] == ["1", '"a"', "1"] and targets[7] == '"a"'
+    assert targets[3] == targets[5] != targets[4]
+    assert targets[6] == "None" and targets[8] == root
+    assert sum(1 for a in di["atoms"] if a["type"] == "Link") == 1